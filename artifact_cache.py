@@ -0,0 +1,115 @@
+import glob
+import hashlib
+import inspect
+import json
+import marshal
+import os
+import pickle
+import time
+
+# --- 디스크 아티팩트 캐시 ---
+# 입력값(seed, 데이터셋 버전, 생성 코드 지문 등)의 해시를 파일 이름으로 삼아 결과를 저장합니다.
+# 모든 Streamlit 워커가 같은 파일을 읽으므로 데이터가 한 번만 만들어지고,
+# 생성 코드가 바뀌면 지문이 달라져 자동으로 새 아티팩트를 만듭니다.
+#   .cache/<namespace>/<지문 12자리>-<키 해시>.pkl
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("DASHBOARD_CACHE_DIR", os.path.join(BASE_DIR, ".cache"))
+
+
+def code_fingerprint(*objs):
+    # 모듈은 파일 내용, 함수는 소스 코드(없으면 바이트코드)로 지문을 만듭니다.
+    digest = hashlib.sha256()
+    for obj in objs:
+        if inspect.ismodule(obj):
+            with open(obj.__file__, "rb") as f:
+                digest.update(f.read())
+        else:
+            try:
+                digest.update(inspect.getsource(obj).encode("utf-8"))
+            except (OSError, TypeError):
+                digest.update(marshal.dumps(obj.__code__))
+    return digest.hexdigest()
+
+
+def artifact_key(parts):
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def artifact_path(namespace, parts, fingerprint="", suffix=".pkl"):
+    key = artifact_key({"parts": parts, "fingerprint": fingerprint})
+    return os.path.join(CACHE_DIR, namespace, f"{fingerprint[:12] or 'nofp'}-{key}{suffix}")
+
+
+def write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    # 여러 워커가 동시에 만들어도 os.replace 덕분에 읽는 쪽은 항상 완전한 파일만 봅니다.
+    os.replace(tmp_path, path)
+
+
+def load_or_build(namespace, parts, build, fingerprint=""):
+    path = artifact_path(namespace, parts, fingerprint)
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # 깨졌거나 다른 라이브러리 버전에서 만든 파일은 다시 만듭니다.
+    value = build()
+    write_atomic(path, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    if fingerprint:
+        evict_stale(namespace, fingerprint)
+    return value
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False  # 다른 워커가 먼저 지운 경우
+
+
+def _artifacts(namespace=None):
+    pattern = os.path.join(CACHE_DIR, namespace or "*", "*")
+    return [p for p in glob.glob(pattern) if os.path.isfile(p) and not p.endswith(".tmp")]
+
+
+def evict_stale(namespace, fingerprint):
+    # 현재 코드 지문과 다른 아티팩트(이전 버전 코드가 만든 것)를 지웁니다.
+    prefix = f"{fingerprint[:12]}-"
+    removed = 0
+    for path in _artifacts(namespace):
+        if not os.path.basename(path).startswith(prefix):
+            removed += _remove(path)
+    return removed
+
+
+def evict(namespace=None, max_age_seconds=None, max_bytes=None):
+    # 오래된 순서로 지워 나이 제한과 용량 제한을 맞춥니다.
+    entries = sorted((os.path.getmtime(p), os.path.getsize(p), p) for p in _artifacts(namespace))
+    now = time.time()
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for mtime, size, path in entries:
+        too_old = max_age_seconds is not None and now - mtime > max_age_seconds
+        too_big = max_bytes is not None and total > max_bytes
+        if not (too_old or too_big):
+            continue
+        total -= size
+        removed += _remove(path)
+    return removed
+
+
+def clear(namespace=None):
+    return sum(_remove(path) for path in _artifacts(namespace))
+
+
+if __name__ == "__main__":
+    import sys
+    namespace = sys.argv[1] if len(sys.argv) > 1 else None
+    print(f"{clear(namespace)}개 아티팩트를 삭제했습니다. ({CACHE_DIR})")
@@ -0,0 +1,85 @@
+import functools
+import threading
+import time
+from collections import defaultdict
+
+import streamlit
+
+# --- AppTest 벤치마크 공용 도구 ---
+# AppTest는 위젯을 움직일 때 항상 스크립트 전체를 실행하므로, st.fragment를 감싸서
+# 각 fragment 본문의 실행 시간을 AppTest별로 따로 기록합니다. (브라우저에서 위젯을 움직일 때의 서버 비용)
+# 스크립트는 AppTest가 만든 별도 스레드에서 돌기 때문에, run()이 세션 상태에 AppTest 번호를 넣어 두고
+# 스크립트 쪽에서는 current_app()으로 어느 AppTest의 실행인지 알아냅니다.
+# 앱(과 games 모듈)이 처음 import되기 전에 install_fragment_timer()를 불러야 합니다.
+
+TAB1, TAB2, TAB3, TAB4, TAB5, TAB6 = ("📈 전 지구 현황", "🇰🇷 대한민국 현황", "🐟 우리의 식탁",
+                                      "🏙️ 미래 시나리오", "🎮 인터랙티브 게임", "📑 종합 보고서")
+
+APP_KEY = "_bench_app"
+
+_lock = threading.Lock()
+_seconds = {}
+_real_fragment = streamlit.fragment
+
+
+def current_app():
+    # 스크립트 스레드 안에서 호출 - 지금 실행 중인 AppTest 번호 (없으면 None)
+    try:
+        return streamlit.session_state.get(APP_KEY)
+    except Exception:
+        return None
+
+
+def _timed_fragment(func=None, **kwargs):
+    if func is None:
+        return lambda f: _timed_fragment(f, **kwargs)
+
+    @functools.wraps(func)
+    def timed(*args, **kw):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kw)
+        finally:
+            app = current_app()
+            if app is not None:
+                with _lock:
+                    _seconds.setdefault(app, defaultdict(float))[func.__name__] += time.perf_counter() - start
+
+    return _real_fragment(timed, **kwargs)
+
+
+def install_fragment_timer():
+    streamlit.fragment = _timed_fragment
+
+
+def fragment_seconds(at):
+    # 이 AppTest의 마지막 run()에서 fragment 이름별로 쌓인 시간(초)
+    with _lock:
+        return _seconds.setdefault(id(at), defaultdict(float))
+
+
+def run(at, tab, timeout):
+    # AppTest는 재실행마다 탭 선택을 잃으므로 매번 다시 지정합니다. 반환값은 재실행 시간(초)입니다.
+    fragment_seconds(at).clear()
+    at.session_state[APP_KEY] = id(at)
+    at.session_state['main_tab'] = tab
+    start = time.perf_counter()
+    at.run(timeout=timeout)
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def slider(at, label):
+    return next(s for s in at.slider if s.label == label)
+
+
+def card_draw(at, i):
+    key = "card_game_restart" if any(b.key == "card_game_restart" for b in at.button) else "card_game_draw"
+    at.button(key=key).click()
+
+
+def mayor_option(at, i):
+    keys = [b.key for b in at.button if b.key and b.key.startswith("mayor_option")] or ["mayor_restart"]
+    at.button(key=keys[i % len(keys)]).click()
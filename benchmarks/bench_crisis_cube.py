@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import crisis_cube
+
+# --- 위기 연쇄 큐브 벤치마크 ---
+# 관측 간격이 제각각인 가상 계열들로 큐브를 만들어
+#   1) 시차 하나의 전체 상관 행렬: pandas shift + corr(매 질의마다 계산)과 큐브 조회
+#   2) 새 연도 하나가 들어왔을 때: 큐브를 처음부터 다시 만들기와 extended()
+# 의 시간을 비교합니다. 결과가 같은지도 확인합니다.
+# 실행: python benchmarks/bench_crisis_cube.py
+
+SIZES = [(35, 12), (120, 40), (400, 80)]  # (연도 수, 계열 수)
+QUERIES = 50
+
+
+def synthetic(n_years, n_series, rng):
+    observations = {}
+    for j in range(n_series):
+        step = rng.choice([1, 2, 5])
+        start = rng.integers(0, n_years // 3)
+        years = np.arange(1900 + start, 1900 + n_years, step)
+        observations[f"s{j}"] = (years, rng.normal(0, 1, len(years)).cumsum() + 0.05 * j * (years - 1900))
+    return observations
+
+
+def pandas_corr(frame, lag):
+    # frame[a]의 t년 값과 frame[b]의 t+lag년 값의 쌍별 상관
+    shifted = frame.shift(-lag)
+    return np.array([[frame[a].corr(shifted[b], min_periods=crisis_cube.MIN_OVERLAP) for b in frame] for a in frame])
+
+
+def timed(fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'연도 x 계열':>12} {'pandas 질의 (ms)':>16} {'큐브 질의 (us)':>15} {'전체 생성 (ms)':>15} {'연도 추가 (ms)':>15}")
+    for n_years, n_series in SIZES:
+        observations = synthetic(n_years, n_series, rng)
+        years, labels, values, flags = crisis_cube.align(observations)
+        frame = pd.DataFrame(values, columns=labels)
+        lags = rng.integers(-crisis_cube.MAX_LAG, crisis_cube.MAX_LAG + 1, QUERIES)
+
+        expected, pandas_s = timed(lambda: [pandas_corr(frame, int(lag)) for lag in lags[:5]])
+        cube = crisis_cube.CrisisCube(years[:-1], labels, values[:-1], flags[:-1])
+        full, build_s = timed(lambda: crisis_cube.CrisisCube(years, labels, values, flags), repeat=3)
+        extended, extend_s = timed(lambda: cube.extended(years, labels, values, flags), repeat=3)
+        start = time.perf_counter()
+        actual = [full.lagged_corr(int(lag))[0] for lag in lags]
+        query_s = (time.perf_counter() - start) / QUERIES
+
+        for lag, want, got in zip(lags[:5], expected, actual[:5]):
+            assert np.allclose(want, got, equal_nan=True, atol=1e-9), lag
+        for lag in range(-crisis_cube.MAX_LAG, crisis_cube.MAX_LAG + 1):
+            for observed_only in (False, True):
+                assert np.allclose(full.lagged_corr(lag, observed_only)[0], extended.lagged_corr(lag, observed_only)[0], equal_nan=True, atol=1e-9)
+        print(f"{f'{n_years} x {n_series}':>12} {pandas_s / 5 * 1000:>16.1f} {query_s * 1e6:>15.1f} {build_s * 1000:>15.1f} {extend_s * 1000:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
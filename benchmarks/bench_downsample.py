@@ -0,0 +1,40 @@
+import os
+import sys
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import downsample
+
+# --- 고해상도 해수면 그래프 다운샘플링 벤치마크 ---
+# 10일/일간 해상도의 30여 년 자료를 그대로 보낼 때와 LTTB/min-max로 줄여 보낼 때의
+# 그림 JSON 크기와 다운샘플링 시간을 비교합니다.
+# 실행: python benchmarks/bench_downsample.py
+
+RESOLUTIONS = {"10일": 36.5, "일간": 365.25, "시간별": 365.25 * 24}
+YEARS = 32
+
+
+def figure_bytes(x, y):
+    fig = go.Figure(go.Scatter(x=x, y=y, mode=downsample.line_mode(len(x)), fill='tozeroy'))
+    return len(fig.to_json())
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'자료':>6} {'점 수':>9} {'원본 (KB)':>10} {'방식':>7} {'점 수':>6} {'축소 (KB)':>10} {'시간 (ms)':>10}")
+    for label, per_year in RESOLUTIONS.items():
+        t = 1993 + np.arange(int(YEARS * per_year)) / per_year
+        y = 3.2 * (t - 1993) + rng.normal(0, 3, len(t))
+        full_kb = figure_bytes(t, y) / 1024
+        for method in downsample.METHODS:
+            start = time.perf_counter()
+            xs, ys = downsample.downsample(t, y, method=method)
+            elapsed = time.perf_counter() - start
+            print(f"{label:>6} {len(t):>9} {full_kb:>10.1f} {method:>7} {len(xs):>6} {figure_bytes(xs, ys) / 1024:>10.1f} {elapsed * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import exposure
+import inundation
+
+# --- 노출 모델 벤치마크 ---
+# 도시 수를 늘려 가며 (도시 x 슬라이더 16단계) 전체를 한 번에 계산하는 시간을
+# 도시/높이마다 따로 계산하는 방식과 비교합니다.
+# 앱의 노출 표에서 (도시, 높이) 한 칸을 찾는 시간도 불리언 마스크로 훑는 방식과 색인 조회로 비교합니다.
+# 실행: python benchmarks/bench_exposure.py
+
+CITY_COUNTS = [5, 100, 500, 1000]
+CELLS = 60 * 90
+
+
+def per_city(elevation, population, assets, levels):
+    affected = np.empty((len(elevation), len(levels)))
+    loss = np.empty_like(affected)
+    for c in range(len(elevation)):
+        for i, level in enumerate(levels):
+            depth = level - elevation[c]
+            affected[c, i] = population[c][depth > 0].sum()
+            loss[c, i] = (assets[c] * np.clip(depth / exposure.DAMAGE_DEPTH_M, 0, 1)).sum()
+    return affected, loss
+
+
+def main():
+    rng = np.random.default_rng(0)
+    levels = inundation.RISE_LEVELS
+    print(f"{'도시 수':>8} {'배치 (ms)':>10} {'개별 (ms)':>10} {'배속':>7}")
+    for n in CITY_COUNTS:
+        elevation = rng.gamma(2.0, 2.0, (n, CELLS)).astype(np.float32) - 1.0
+        population = rng.lognormal(5, 1, (n, CELLS))
+        assets = population * rng.uniform(5e4, 5e5, (n, 1))
+
+        start = time.perf_counter()
+        batch = exposure.evaluate(elevation, population, assets, levels)
+        batch_s = time.perf_counter() - start
+        start = time.perf_counter()
+        loop = per_city(elevation, population, assets, levels)
+        loop_s = time.perf_counter() - start
+        assert np.allclose(batch[0], loop[0]) and np.allclose(batch[1], loop[1])
+        print(f"{n:>8} {batch_s * 1000:>10.1f} {loop_s * 1000:>10.1f} {loop_s / batch_s:>6.1f}x")
+
+    table = exposure.exposure_table()
+    queries = [(key, float(level)) for key in exposure.CITY_PROFILES for level in levels]
+    exposure.lookup(*queries[0])
+    start = time.perf_counter()
+    for key, level in queries:
+        row = table[(table['city'] == key) & np.isclose(table['상승 높이 (m)'], level)]
+        assert exposure.lookup(key, level)[0] == int(row['영향 인구 (명)'].iloc[0])
+    mask_s = (time.perf_counter() - start) / len(queries)
+    start = time.perf_counter()
+    for key, level in queries:
+        exposure.lookup(key, level)
+    index_s = (time.perf_counter() - start) / len(queries)
+    print(f"표 조회 (us): 불리언 마스크 {mask_s * 1e6:.1f}, 색인 {index_s * 1e6:.1f}")
+
+
+if __name__ == "__main__":
+    main()
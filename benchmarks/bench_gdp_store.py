@@ -0,0 +1,74 @@
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gdp_store
+
+# --- GDP 저장소 벤치마크 ---
+# data/gdp_data.csv를 임시 폴더의 저장소로 적재한 뒤
+#   1) 열기: pandas read_csv와 GdpStore(mmap)
+#   2) select: 국가 전체/하나/연속 구간은 mmap 위의 뷰(복사 없음), 흩어진 국가 목록만 복사인지 확인
+#   3) aggregate: 국가/연도 방향 집계를 pandas 결과와 비교, 모르는 over 값은 ValueError인지 확인
+# 의 시간과 결과를 출력합니다.
+# 실행: python benchmarks/bench_gdp_store.py
+
+QUERIES = 500
+
+
+def timed(fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    with tempfile.TemporaryDirectory() as store_dir:
+        _, ingest_s = timed(lambda: gdp_store.ingest(gdp_store.DEFAULT_CSV, store_dir))
+        frame, csv_s = timed(lambda: pd.read_csv(gdp_store.DEFAULT_CSV), repeat=5)
+        store, open_s = timed(lambda: gdp_store.GdpStore(store_dir), repeat=5)
+        print(f"적재 {ingest_s * 1000:.1f} ms / 열기: read_csv {csv_s * 1000:.1f} ms, GdpStore {open_s * 1000:.2f} ms")
+
+        codes = store.country_codes
+        contiguous = codes[10:20]
+        scattered = codes[::25]
+        print(f"{'select':>16} {'모양':>10} {'뷰':>4} {'시간 (us)':>10}")
+        for label, countries in (("전체", None), ("한 국가", "KOR"), ("연속 구간", contiguous), ("흩어진 목록", scattered)):
+            (_, block), select_s = timed(lambda: store.select(countries, 1993, 2022), repeat=QUERIES)
+            shares = np.shares_memory(block, store.values)
+            assert shares == (label != "흩어진 목록"), label
+            print(f"{label:>16} {str(block.shape):>10} {'예' if shares else '아니오':>4} {select_s * 1e6:>10.1f}")
+
+        # pandas 기준값: 연도 열만 남긴 (국가 x 연도) 표
+        table = frame.set_index('Country Code')[[str(y) for y in store.years]]
+        table.columns = store.years
+        table = table.loc[codes]
+        print(f"{'aggregate':>16} {'pandas (us)':>12} {'저장소 (us)':>12}")
+        for how in ("sum", "mean", "max"):
+            for over in gdp_store._AGGREGATE_AXES:
+                axis = 0 if over == "countries" else 1
+                expected, pandas_s = timed(lambda: getattr(table.loc[:, 1993:2022], how)(axis=axis, skipna=True), repeat=20)
+                (_, result), store_s = timed(lambda: store.aggregate(how, start=1993, end=2022, over=over), repeat=20)
+                expected = expected.to_numpy(dtype=np.float64)
+                if how == "sum":
+                    # pandas는 값이 하나도 없는 합을 0으로, 저장소는 NaN으로 돌려줍니다.
+                    expected = np.where(np.isnan(result), np.nan, expected)
+                assert np.allclose(result, expected, equal_nan=True, rtol=1e-12), (how, over)
+                print(f"{f'{how}/{over}':>16} {pandas_s * 1e6:>12.1f} {store_s * 1e6:>12.1f}")
+
+        for over in ("country", "rows"):
+            try:
+                store.aggregate("sum", over=over)
+            except ValueError as e:
+                print(f"over={over!r}: ValueError ({e})")
+            else:
+                raise AssertionError(f"over={over!r}가 거부되지 않았습니다.")
+
+
+if __name__ == "__main__":
+    main()
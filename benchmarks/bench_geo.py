@@ -0,0 +1,74 @@
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import geo_cache
+
+# --- 단순화 GeoJSON 캐시 벤치마크 ---
+# 시군구 수준(약 250개)의 가상 경계 - 이웃 칸과 공유하는 구불구불한 경계를 가진 격자 - 를 만들어
+# 허용 오차별 꼭짓점 수와 지도에 실리는 GeoJSON 크기, 캐시 생성 시간을 봅니다.
+# 실행: python benchmarks/bench_geo.py
+
+ROWS, COLS = 14, 18
+EDGE_POINTS = 60
+ORIGIN = (125.0, 33.5)
+CELL = 0.25  # 도
+
+
+def wiggly(p, q, rng_seed):
+    # 같은 경계는 양쪽 칸에서 같은 좌표가 나오도록 끝점으로 시드를 정합니다.
+    rng = np.random.default_rng(rng_seed)
+    t = np.linspace(0, 1, EDGE_POINTS)[:, np.newaxis]
+    line = np.asarray(p) * (1 - t) + np.asarray(q) * t
+    normal = np.array([-(q[1] - p[1]), q[0] - p[0]])
+    bump = np.sin(np.pi * t) * rng.normal(0, 0.03, (EDGE_POINTS, 1)).cumsum(axis=0) * 0.2
+    return (line + bump * normal).tolist()
+
+
+def edge(a, b):
+    key = (min(a, b), max(a, b))
+    points = wiggly(node(*key[0]), node(*key[1]), hash(key) & 0xFFFFFFFF)
+    return points if key == (a, b) else points[::-1]
+
+
+def node(r, c):
+    return (ORIGIN[0] + c * CELL, ORIGIN[1] + r * CELL)
+
+
+def synthetic_geojson():
+    features = []
+    for r in range(ROWS):
+        for c in range(COLS):
+            corners = [(r, c), (r, c + 1), (r + 1, c + 1), (r + 1, c)]
+            ring = []
+            for a, b in zip(corners, corners[1:] + corners[:1]):
+                ring.extend(edge(a, b)[:-1])
+            ring.append(ring[0])
+            features.append({"type": "Feature", "properties": {"name": f"구역-{r:02d}-{c:02d}", "code": f"{r * COLS + c}"},
+                             "geometry": {"type": "Polygon", "coordinates": [ring]}})
+    return {"type": "FeatureCollection", "features": features}
+
+
+def main():
+    geojson = synthetic_geojson()
+    raw_kb = len(json.dumps(geojson, ensure_ascii=False)) / 1024
+    start = time.perf_counter()
+    cache = geo_cache.GeoCache.build(geojson)
+    build_s = time.perf_counter() - start
+    print(f"원본: {len(geojson['features'])}개 지역, {raw_kb:.0f} KB, 캐시 생성 {build_s * 1000:.0f} ms")
+    print(f"{'허용 오차':>10} {'꼭짓점':>8} {'GeoJSON (KB)':>13} {'subset (ms)':>12}")
+    for tolerance in cache.levels:
+        start = time.perf_counter()
+        subset = cache.subset(None, tolerance)
+        elapsed = time.perf_counter() - start
+        size_kb = len(json.dumps(subset, ensure_ascii=False)) / 1024
+        print(f"{tolerance:>10} {cache.vertex_counts[tolerance]:>8} {size_kb:>13.0f} {elapsed * 1000:>12.2f}")
+    print(f"지도 폭 970px에서 고른 허용 오차: {cache.pick_tolerance(970)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from streamlit.elements.lib import image_utils
+from streamlit.elements.lib.layout_utils import LayoutConfig
+
+import image_pipeline
+
+# --- 도시 시나리오 이미지 벤치마크 ---
+# st.image가 서버에서 하는 처리(형식 판별, 크기 조정, 재인코딩)를 그대로 호출해서
+# 기존 PNG 경로와 미리 줄인 JPEG 경로의 전송 바이트와 렌더 지연을 비교합니다.
+# 실행: python benchmarks/bench_images.py
+
+REPEAT = 5
+
+
+def streamlit_image_bytes(image):
+    # streamlit.elements.lib.image_utils.image_to_url()에서 파일 읽기와 변환 부분만 떼어 왔습니다.
+    if isinstance(image, str):
+        with open(image, "rb") as f:
+            image = f.read()
+    image_format = image_utils._validate_image_format_string(image, "auto")
+    return image_utils._ensure_image_size_and_format(image, LayoutConfig(width="content"), image_format)
+
+
+def measure(fn):
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        sent = fn()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return len(sent), times[len(times) // 2]
+
+
+def main():
+    width = image_pipeline.pick_width(1.0)
+    paths = sorted(glob.glob(os.path.join(image_pipeline.IMAGE_DIR, "*.png")))
+    start = time.perf_counter()
+    for path in paths:
+        image_pipeline.build_variants(path)
+    print(f"변형 생성(처음 한 번): {time.perf_counter() - start:.2f}s, 표시 폭 {width}px\n")
+
+    print(f"{'이미지':<16} {'원본 PNG':>10} {'PNG 경로 전송':>14} {'ms':>8} {'캐시 경로 전송':>14} {'ms':>8} {'WebP':>10}")
+    totals = [0, 0, 0]
+    for path in paths:
+        png_sent, png_ms = measure(lambda: streamlit_image_bytes(path))
+        cached_sent, cached_ms = measure(lambda: streamlit_image_bytes(image_pipeline.get_image(path, width)))
+        webp = len(image_pipeline.get_image(path, width, "webp"))
+        totals[0] += png_sent
+        totals[1] += cached_sent
+        totals[2] += webp
+        print(f"{os.path.basename(path):<16} {os.path.getsize(path):>10,} {png_sent:>14,} {png_ms * 1000:>8.1f}"
+              f" {cached_sent:>14,} {cached_ms * 1000:>8.1f} {webp:>10,}")
+    print(f"\n세션당 5개 도시 전송량: PNG 경로 {totals[0]:,} bytes -> 캐시 경로 {totals[1]:,} bytes"
+          f" (WebP 사용 시 {totals[2]:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import apptest_utils as u
+
+# --- 위젯 상호작용별 서버 시간 벤치마크 ---
+# 위젯마다 값을 여러 번 바꿔 가며 두 가지 시간을 잽니다.
+#   전체 재실행: 패널을 fragment로 나누기 전처럼 스크립트 전체(열린 탭 포함)를 다시 실행하는 시간
+#   fragment: 그 위젯이 속한 fragment 함수 본문만 실행하는 시간 (지금 브라우저에서 위젯을 움직일 때의 비용)
+# fragment 열에는 Streamlit의 재실행 자체 비용(빈 스크립트 실행 시간, 맨 아래 출력)이 빠져 있습니다.
+# 실행: python benchmarks/bench_interactions.py
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "streamlit_app.py")
+ROUNDS = 4
+TIMEOUT = 300
+
+u.install_fragment_timer()
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+# (위젯, 탭, fragment 이름, i번째 상호작용)
+INTERACTIONS = [
+    ("해수면 기간 슬라이더", u.TAB1, "gmsl_panel", lambda at, i: u.slider(at, '해수면 데이터 분석 기간 선택').set_value((1993 + 2 * i, 2024 - i))),
+    ("세계 지도 연도 슬라이더", u.TAB1, "world_map_panel", lambda at, i: u.slider(at, '지도 데이터 연도 선택').set_value(2000 + 3 * i)),
+    ("세계 지도 애니메이션 토글", u.TAB1, "world_map_panel", lambda at, i: at.toggle(key='map_animate').set_value(i % 2 == 0)),
+    ("온실가스 기간 슬라이더", u.TAB1, "ghg_panel", lambda at, i: u.slider(at, '온실가스 데이터 분석 기간 선택').set_value((1990 + 5 * (i % 3), 2020))),
+    ("대한민국 지도 연도 슬라이더", u.TAB2, "korea_map_panel", lambda at, i: at.slider(key='slider_kr').set_value(2002 + 4 * i)),
+    ("대한민국 지도 애니메이션 토글", u.TAB2, "korea_map_panel", lambda at, i: at.toggle(key='map_animate_kr').set_value(i % 2 == 0)),
+    ("상승 높이 슬라이더", u.TAB4, "city_panel", lambda at, i: u.slider(at, '미래 해수면 상승 높이 선택 (단위: m)').set_value(round(0.6 + 0.3 * i, 1))),
+    ("도시 선택", u.TAB4, "city_panel", lambda at, i: at.selectbox[0].set_value(at.selectbox[0].options[(i + 1) % len(at.selectbox[0].options)])),
+    ("앙상블 크기", u.TAB4, "projection_panel", lambda at, i: at.select_slider[0].set_value([1000, 5000, 20000][i % 3])),
+    ("카드 뽑기", u.TAB5, "card_game", u.card_draw),
+    ("시장 선택지", u.TAB5, "mayor_game", u.mayor_option),
+]
+
+
+def blank_overhead():
+    at = AppTest.from_string("import streamlit as st\nst.write('')", default_timeout=TIMEOUT)
+    at.run()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        at.run()
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def main():
+    logging.disable(logging.WARNING)
+    at = AppTest.from_file(APP, default_timeout=TIMEOUT)
+    print(f"{'위젯':<18} {'fragment':<18} {'전체 재실행 (ms)':>16} {'fragment (ms)':>14} {'배속':>7}")
+    for label, tab, fragment, interact in INTERACTIONS:
+        u.run(at, tab, TIMEOUT)
+        full, partial = [], []
+        for i in range(ROUNDS):
+            interact(at, i)
+            full.append(u.run(at, tab, TIMEOUT))
+            partial.append(u.fragment_seconds(at)[fragment])
+        full_ms, partial_ms = statistics.median(full) * 1000, statistics.median(partial) * 1000
+        print(f"{label:<18} {fragment:<18} {full_ms:>16.1f} {partial_ms:>14.1f} {full_ms / max(partial_ms, 1e-3):>6.1f}x")
+    print(f"(참고) 빈 스크립트 재실행 비용: {blank_overhead() * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
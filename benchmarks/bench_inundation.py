@@ -0,0 +1,40 @@
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import image_pipeline
+import inundation
+
+# --- 침수 렌더러 벤치마크 ---
+# 슬라이더 단계마다 처음 그릴 때(합성 + JPEG 인코딩)와 캐시에서 꺼낼 때의 지연을 잽니다. 목표: 단계당 50ms 미만
+# 실행: python benchmarks/bench_inundation.py
+
+
+def main():
+    width = image_pipeline.pick_width(1.0)
+    print(f"{'도시':<12} {'준비 ms':>8} {'첫 렌더 중앙값':>14} {'최대':>8} {'캐시 ms':>8}")
+    for path in sorted(glob.glob(os.path.join(image_pipeline.IMAGE_DIR, "*.png"))):
+        start = time.perf_counter()
+        image_pipeline.build_variants(path, widths=(width,), formats=("jpeg",))
+        inundation.flood_index(inundation.city_key(path))
+        inundation._base_image(path, width)
+        prepare = time.perf_counter() - start
+
+        cold = []
+        for level in inundation.RISE_LEVELS:
+            start = time.perf_counter()
+            inundation.render(path, level, width)
+            cold.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for level in inundation.RISE_LEVELS:
+            inundation.render(path, level, width)
+        warm = (time.perf_counter() - start) / len(inundation.RISE_LEVELS)
+        cold.sort()
+        print(f"{inundation.city_key(path):<12} {prepare * 1000:>8.1f} {cold[len(cold) // 2] * 1000:>14.1f}"
+              f" {cold[-1] * 1000:>8.1f} {warm * 1000:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
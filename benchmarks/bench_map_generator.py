@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_gen import COUNTRIES, generate_map_df
+
+# --- 지도 데이터 생성기 벤치마크 ---
+# 기존 load_data()의 이중 반복문과 배치 생성기를 (시간 x 국가) 격자 크기별로 비교합니다.
+# 실행: python benchmarks/bench_map_generator.py
+
+GRIDS = [(32, 21), (120, 21), (384, 100), (1000, 250), (10000, 250)]
+LOOP_CELL_LIMIT = 300_000  # 이보다 큰 격자는 반복문 버전이 너무 오래 걸려 생략합니다.
+
+
+def loop_map_df(countries, n_years):
+    map_years = np.arange(1993, 1993 + n_years)
+    map_df_list = []
+    base_rates = {country: np.random.uniform(2.5, 5.5) for country in countries}
+    for year in map_years:
+        for country in countries:
+            rate = base_rates[country] + (year - 1993) * np.random.uniform(0.01, 0.05)
+            map_df_list.append({'연도': year, 'country_iso': country, 'rise_rate_mm_year': rate})
+    return pd.DataFrame(map_df_list)
+
+
+def synthetic_countries(n):
+    if n <= len(COUNTRIES):
+        return COUNTRIES[:n]
+    return COUNTRIES + [f"X{i:05d}" for i in range(n - len(COUNTRIES))]
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    print(f"{'격자 (시간x국가)':>18} {'셀 수':>12} {'반복문 (s)':>12} {'배치 (s)':>10} {'배속':>8}")
+    for n_time, n_countries in GRIDS:
+        countries = synthetic_countries(n_countries)
+        cells = n_time * n_countries
+        repeat = 5 if cells < 1_000_000 else 1
+        vec = best_of(lambda: generate_map_df(countries, 1993, 1993 + n_time - 1, seed=0), repeat)
+        if cells <= LOOP_CELL_LIMIT:
+            loop = best_of(lambda: loop_map_df(countries, n_time), 1 if cells > 10_000 else repeat)
+            print(f"{n_time:>9} x {n_countries:<6} {cells:>12,} {loop:>12.4f} {vec:>10.4f} {loop / vec:>7.1f}x")
+        else:
+            print(f"{n_time:>9} x {n_countries:<6} {cells:>12,} {'-':>12} {vec:>10.4f} {'-':>8}")
+
+    a = generate_map_df(seed=42)
+    b = generate_map_df(seed=42)
+    print("같은 seed 재현성:", a.equals(b))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# --- 시작 시간 벤치마크 ---
+# 매번 새 파이썬 프로세스에서 잽니다. (모듈/캐시가 하나도 올라와 있지 않은 자동 확장 인스턴스의 첫 요청과 같은 조건)
+#   1) 모듈별 import 시간과 그 import가 새로 불러온 plotly 모듈 수 (streamlit을 먼저 불러온 뒤 앱이 쓰는 순서대로)
+#      streamlit이 테마 등록을 위해 plotly.graph_objects를 불러오므로, 앱 모듈의 plotly 열은 0이어야 합니다.
+#   2) 첫 실행의 단계별 시간 - 스크립트 시작 -> 제목/탭 틀(shell) -> 무거운 모듈(imports) -> 첫 화면 완료(first_paint)
+#      빈 캐시 디렉터리(cold)와 prewarm.py를 미리 돌린 캐시 디렉터리(prewarmed)를 비교합니다.
+# 실행: python benchmarks/bench_startup.py
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUNDS = 3
+IMPORTS = ["streamlit", "numpy", "pandas", "data_sources", "datasets", "figure_cache", "trend_analysis", "crisis_cube",
+           "year_index", "projection", "exposure", "inundation", "map_frames", "games",
+           "plotly.express", "statsmodels.nonparametric.smoothers_lowess"]
+PHASES = ["script", "shell", "imports", "first_paint"]
+
+
+def plotly_modules():
+    return {name for name in sys.modules if name == "plotly" or name.startswith("plotly.")}
+
+
+def child_imports():
+    times, plotly = {}, {}
+    for name in IMPORTS:
+        before = plotly_modules()
+        start = time.perf_counter()
+        __import__(name)
+        times[name] = (time.perf_counter() - start) * 1000
+        plotly[name] = len(plotly_modules() - before)
+    return {"times": times, "plotly": plotly}
+
+
+def child_phases():
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    import startup
+    loaded = time.perf_counter()
+    plotly_before = plotly_modules()
+    at = AppTest.from_file(os.path.join(ROOT, "streamlit_app.py"), default_timeout=600)
+    at.run()
+    done = time.perf_counter()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    marks = startup.marks()
+    import figure_cache
+    stats = figure_cache.stats()
+    return {
+        "streamlit 불러오기": (loaded - start) * 1000,
+        **{f"{a} -> {b}": (marks[b] - marks[a]) * 1000 for a, b in zip(PHASES, PHASES[1:])},
+        "첫 실행 전체": (done - loaded) * 1000,
+        "plotly.express 불러옴": "plotly.express" in sys.modules,
+        "앱이 불러온 plotly 모듈": len(plotly_modules() - plotly_before),
+        "그림 생성/디스크": f"{stats['misses']}/{stats['disk_hits']}",
+        "캐시 그림 검증 생략": figure_cache._passes_through(),
+    }
+
+
+def run_child(kind, cache_dir):
+    env = dict(os.environ, DASHBOARD_CACHE_DIR=cache_dir, DASHBOARD_PREWARM="0", PYTHONPATH=ROOT)
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", kind], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def median_rows(rows):
+    result = {}
+    for key, value in rows[0].items():
+        values = sorted(r[key] for r in rows)
+        result[key] = values[len(values) // 2]
+    return result
+
+
+def print_table(title, columns):
+    print(f"\n[{title}]")
+    keys = list(next(iter(columns.values())))
+    width = max(len(key) for key in keys) + 2
+    print(" " * width + "".join(f"{name:>14}" for name in columns))
+    for key in keys:
+        cells = []
+        for column in columns.values():
+            value = column[key]
+            cells.append(f"{value:>14.1f}" if isinstance(value, float) else f"{str(value):>14}")
+        print(f"{key:<{width}}" + "".join(cells))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as cold_dir, tempfile.TemporaryDirectory() as warm_dir:
+        rounds = [run_child("imports", cold_dir) for _ in range(ROUNDS)]
+        imports = median_rows([r["times"] for r in rounds])
+        print_table("모듈 import", {"ms": imports, "plotly 모듈": rounds[0]["plotly"]})
+
+        # cold: 매번 빈 캐시 디렉터리에서 시작합니다.
+        cold = []
+        for i in range(ROUNDS):
+            cold.append(run_child("phases", os.path.join(cold_dir, str(i))))
+        env = dict(os.environ, DASHBOARD_CACHE_DIR=warm_dir, PYTHONPATH=ROOT)
+        subprocess.run([sys.executable, os.path.join(ROOT, "prewarm.py")], cwd=ROOT, env=env,
+                       capture_output=True, check=True)
+        warm = [run_child("phases", warm_dir) for _ in range(ROUNDS)]
+        print_table("첫 실행 단계 (ms, 탭 1)", {"cold": median_rows(cold), "prewarmed": median_rows(warm)})
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--child":
+        import logging
+        logging.disable(logging.WARNING)
+        print(json.dumps(child_imports() if sys.argv[2] == "imports" else child_phases(), ensure_ascii=False))
+    else:
+        main()
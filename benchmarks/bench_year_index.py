@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import year_index
+
+# --- 연도 색인 시계열 벤치마크 ---
+# 연간(32점), 월간, 일간 해수면 자료에서 탭 1의 구간 지표(첫/끝 값, 기울기, 최소/최대)를
+# 불리언 마스크 + iloc 방식과 YearSeries 조회로 각각 계산하는 시간을 비교합니다.
+# 실행: python benchmarks/bench_year_index.py
+
+RESOLUTIONS = {"연간": 1, "월간": 12, "일간": 365}
+QUERIES = 2000
+
+
+def mask_metrics(df, start, end):
+    filtered = df[(df['연도'] >= start) & (df['연도'] <= end)]
+    values = filtered['해수면 높이 (mm)']
+    slope = np.polyfit(filtered['연도'], values, 1)[0]
+    return values.iloc[0], values.iloc[-1], slope, values.min(), values.max()
+
+
+def index_metrics(series, start, end):
+    column = '해수면 높이 (mm)'
+    return (series.first(column, start, end), series.last(column, start, end), series.slope(column, start, end),
+            series.min(column, start, end), series.max(column, start, end))
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'자료':>6} {'점 수':>8} {'마스크 (us)':>12} {'색인 (us)':>10} {'배속':>7}")
+    for label, per_year in RESOLUTIONS.items():
+        years = 1993 + np.arange(32 * per_year) / per_year
+        levels = 3.2 * (years - 2020) + rng.normal(0, 4, len(years)).cumsum() * 0.1
+        df = pd.DataFrame({'연도': years, '해수면 높이 (mm)': levels})
+        series = year_index.YearSeries.from_frame(df)
+        ranges = np.sort(rng.integers(1993, 2024, (QUERIES, 2)), axis=1)
+        ranges[:, 1] = np.maximum(ranges[:, 1], ranges[:, 0] + 1)
+
+        start = time.perf_counter()
+        expected = [mask_metrics(df, a, b) for a, b in ranges]
+        mask_s = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = [index_metrics(series, a, b) for a, b in ranges]
+        index_s = time.perf_counter() - start
+        assert np.allclose(expected, actual)
+        print(f"{label:>6} {len(years):>8} {mask_s / QUERIES * 1e6:>12.1f} {index_s / QUERIES * 1e6:>10.1f} {mask_s / index_s:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
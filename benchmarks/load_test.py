@@ -0,0 +1,247 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, ROOT)
+import apptest_utils as u
+
+# --- 대시보드 부하 테스트 ---
+# AppTest로 가상 세션 여러 개를 한 프로세스 안의 스레드에서 동시에 돌립니다.
+# 실제 서버처럼 데이터셋/그림/이미지 캐시를 모든 세션이 공유합니다.
+# 세션 하나는 실제 사용 흐름을 따라 위젯을 움직입니다. 세션마다 seed가 달라서 고르는 값도 다릅니다.
+#   탭 1 기간 슬라이더 -> 세계 지도 연도 훑기 -> 탭 4 도시/상승 높이 -> 탭 5 카드 게임/시장 게임
+# 상호작용마다 다음을 모읍니다.
+#   - 재실행 시간: AppTest 스크립트 전체 실행
+#   - fragment 시간: 브라우저에서 위젯을 움직일 때 실제로 다시 실행되는 부분
+#   - 그림 캐시 적중 여부
+# 끝나면 백분위, 최대 RSS, 캐시 통계를 JSON으로 내보냅니다.
+# 실행: python benchmarks/load_test.py --sessions 16 --concurrency 8 --out results.json
+
+TIMEOUT = 600
+PERCENTILES = (50, 90, 95, 99)
+
+u.install_fragment_timer()
+from streamlit.runtime.scriptrunner import magic  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import figure_cache  # noqa: E402
+import datasets  # noqa: E402
+import image_pipeline  # noqa: E402
+
+_lock = threading.Lock()
+_interaction = {}  # AppTest 번호 -> 지금 진행 중인 상호작용 이름
+_figure_lookups = defaultdict(lambda: [0, 0])  # 상호작용 -> [적중, 생성]
+_real_get_or_build = figure_cache.get_or_build
+_real_add_magic = magic.add_magic
+
+
+def _serial_add_magic(code, script_path):
+    # Python 3.11의 ast.parse는 여러 스레드에서 동시에 부르면 SystemError를 낼 수 있어
+    # 재실행마다 하는 스크립트 파싱만 한 번에 하나씩 합니다.
+    with _lock:
+        return _real_add_magic(code, script_path)
+
+
+magic.add_magic = _serial_add_magic
+
+
+def _tracked_get_or_build(fig_id, inputs, build, deps=()):
+    # build가 호출되면 캐시 미스입니다. 상호작용 이름은 AppTest 번호로 찾습니다.
+    built = []
+
+    def wrapped():
+        built.append(True)
+        return build()
+
+    result = _real_get_or_build(fig_id, inputs, wrapped, deps=deps)
+    with _lock:
+        _figure_lookups[_interaction.get(u.current_app(), "?")][1 if built else 0] += 1
+    return result
+
+
+figure_cache.get_or_build = _tracked_get_or_build
+
+
+def session_script(rng):
+    # (상호작용 이름, 탭, fragment 이름, 위젯 조작 함수 또는 None) 목록
+    steps = [("open_tab1", u.TAB1, None, None)]
+    for _ in range(2):
+        start = int(rng.integers(1993, 2015))
+        end = int(rng.integers(start + 5, 2025))
+        steps.append(("gmsl_range", u.TAB1, "gmsl_panel",
+                      lambda at, r=(start, end): u.slider(at, '해수면 데이터 분석 기간 선택').set_value(r)))
+    first = int(rng.integers(1993, 2016))
+    for year in range(first, first + 9, 2):
+        steps.append(("map_year", u.TAB1, "world_map_panel",
+                      lambda at, y=year: u.slider(at, '지도 데이터 연도 선택').set_value(y)))
+    steps.append(("open_tab4", u.TAB4, None, None))
+    for _ in range(2):
+        pick = int(rng.integers(0, 5))
+        steps.append(("city_select", u.TAB4, "city_panel",
+                      lambda at, p=pick: at.selectbox[0].set_value(at.selectbox[0].options[p])))
+        for level in sorted(rng.choice(np.round(np.arange(0.5, 2.01, 0.1), 1), 3, replace=False)):
+            steps.append(("rise_level", u.TAB4, "city_panel",
+                          lambda at, lv=float(level): u.slider(at, '미래 해수면 상승 높이 선택 (단위: m)').set_value(lv)))
+    steps.append(("open_tab5", u.TAB5, None, None))
+    for i in range(8):
+        steps.append(("card_draw", u.TAB5, "card_game", lambda at, i=i: u.card_draw(at, i)))
+    for i in range(7):
+        choice = int(rng.integers(0, 2))
+        steps.append(("mayor_option", u.TAB5, "mayor_game", lambda at, c=choice: u.mayor_option(at, c)))
+    return steps
+
+
+def run_session(session_id, seed, think_time):
+    rng = np.random.default_rng([seed, session_id])
+    at = AppTest.from_file(os.path.join(ROOT, "streamlit_app.py"), default_timeout=TIMEOUT)
+    records = []
+    for name, tab, fragment, interact in session_script(rng):
+        _interaction[id(at)] = name
+        try:
+            if interact is not None:
+                interact(at)
+            rerun = u.run(at, tab, TIMEOUT)
+            error = None
+        except Exception as e:
+            rerun, error = None, f"{type(e).__name__}: {e}"
+        records.append({"session": session_id, "interaction": name, "rerun_s": rerun,
+                        "fragment_s": u.fragment_seconds(at).get(fragment) if fragment else None, "error": error})
+        if think_time:
+            time.sleep(random.uniform(0, think_time))
+    return records
+
+
+def _rss_mb():
+    # 현재 RSS (Linux /proc 기준, 없으면 None)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        return None
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def _summary(seconds):
+    values = np.array([s for s in seconds if s is not None]) * 1000
+    if not len(values):
+        return None
+    result = {f"p{p}": round(float(np.percentile(values, p)), 2) for p in PERCENTILES}
+    result.update(mean=round(float(values.mean()), 2), max=round(float(values.max()), 2))
+    return result
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 부하 테스트 (AppTest 가상 세션)")
+    parser.add_argument("--sessions", type=int, default=8, help="가상 세션 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 돌리는 세션 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--think-time", type=float, default=0.0, help="상호작용 사이 최대 대기 시간(초)")
+    parser.add_argument("--out", help="결과 JSON 파일 (없으면 표준 출력)")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    rss_start = _rss_mb()
+    samples = []
+    stop = threading.Event()
+
+    def sample_rss():
+        while not stop.wait(0.2):
+            samples.append(_rss_mb())
+
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(run_session, i, args.seed, args.think_time) for i in range(args.sessions)]
+        records = [r for f in futures for r in f.result()]
+    wall = time.perf_counter() - started
+    stop.set()
+    sampler.join()
+
+    by_interaction = defaultdict(list)
+    for r in records:
+        by_interaction[r["interaction"]].append(r)
+    interactions = {}
+    for name, rows in by_interaction.items():
+        hits, misses = _figure_lookups.get(name, (0, 0))
+        interactions[name] = {
+            "count": len(rows),
+            "errors": sum(r["error"] is not None for r in rows),
+            "rerun_ms": _summary(r["rerun_s"] for r in rows),
+            "fragment_ms": _summary(r["fragment_s"] for r in rows),
+            "figure_cache": {"hits": hits, "misses": misses,
+                             "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None},
+        }
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "streamlit": __import__("streamlit").__version__,
+            "cpu_count": os.cpu_count(),
+            "sessions": args.sessions,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "think_time_s": args.think_time,
+        },
+        "wall_s": round(wall, 3),
+        "reruns_per_s": round(sum(r["rerun_s"] is not None for r in records) / wall, 3),
+        "overall": {"rerun_ms": _summary(r["rerun_s"] for r in records),
+                    "fragment_ms": _summary(r["fragment_s"] for r in records)},
+        "interactions": interactions,
+        "memory": {"rss_start_mb": rss_start, "rss_peak_sampled_mb": max(filter(None, samples), default=None),
+                   "peak_rss_mb": round(_peak_rss_mb(), 1)},
+        "caches": {
+            "figure_cache": figure_cache.stats(),
+            "image_cache": image_pipeline.stats(),
+            "datasets": {"loads": sum(d["loads"] for d in datasets.stats()), "hits": sum(d["hits"] for d in datasets.stats())},
+        },
+        "errors": [r for r in records if r["error"]][:20],
+    }
+
+    text = json.dumps(report, ensure_ascii=False, indent=2, default=float)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    print(f"{'상호작용':<14} {'횟수':>5} {'재실행 p50':>10} {'p95':>8} {'fragment p50':>13} {'p95':>8} {'그림 캐시':>9}", file=sys.stderr)
+    for name, row in interactions.items():
+        rerun, frag, cache = row["rerun_ms"] or {}, row["fragment_ms"] or {}, row["figure_cache"]
+        hit = "-" if cache["hit_rate"] is None else f"{cache['hit_rate']:.0%}"
+        print(f"{name:<14} {row['count']:>5} {rerun.get('p50', float('nan')):>10.1f} {rerun.get('p95', float('nan')):>8.1f} "
+              f"{frag.get('p50', float('nan')):>13.1f} {frag.get('p95', float('nan')):>8.1f} {hit:>9}", file=sys.stderr)
+    print(f"총 {len(records)}회 / {wall:.1f}s, 최대 RSS {report['memory']['peak_rss_mb']} MB", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+import datasets
+import spans
+
+# --- 위기 연쇄 분석 큐브 ---
+# 온실가스(5년 간격), 해수면(매년), 어획량/양식(매년·2년 간격), 영양 섭취(불규칙)를 한 연도 축(1년 간격)에 맞춘
+# (연도 x 계열) 값 행렬입니다. 각 계열은 관측 구간 안에서만 선형 보간하고 밖은 비워 둡니다. (외삽하지 않음)
+# flags는 칸마다 관측(OBSERVED)/보간(INTERPOLATED)/없음(MISSING)을 표시합니다.
+#
+# 시차 상관: lag=k는 계열 A의 t년 값과 계열 B의 t+k년 값의 상관입니다. (k > 0이면 A가 B보다 k년 앞섬)
+# 시차 -MAX_LAG..MAX_LAG마다 두 값이 모두 있는 해만 쓰는 합(n, Σa, Σb, Σa², Σb², Σab)을 모든 계열 쌍에 대해
+# 행렬곱으로 미리 쌓아 두므로, 시차/쌍 질의는 (계열 x 계열) 행렬 조회입니다.
+# 보간값을 포함한 합과 관측값끼리만의 합을 따로 둡니다.
+#
+# 새 연도 자료가 들어오면 extended()가 처음으로 값이 달라진 해부터 그 뒤에 걸친 쌍의 몫만 빼고 다시 더합니다.
+# (관측 구간 끝 뒤는 비어 있었으므로 새 관측값은 마지막 관측 연도 이후의 행만 바꿉니다)
+
+OBSERVED, INTERPOLATED, MISSING = 0, 1, 2
+MAX_LAG = 10
+MIN_OVERLAP = 4  # 상관을 내는 최소 겹치는 해 수
+
+# (데이터셋, 열, 표시 이름, 연쇄 단계)
+SERIES = (
+    ('ghg', '총 배출량(백만 톤 CO2eq)', '온실가스 배출량', '원인'),
+    ('ghg', 'CO2 비율(%)', 'CO2 비율', '원인'),
+    ('gmsl', '해수면 높이 (mm)', '해수면 높이', '해수면'),
+    ('fish_production', '멸치 생산량 (톤)', '멸치', '어획·양식'),
+    ('fish_production', '갈치 생산량 (톤)', '갈치', '어획·양식'),
+    ('fish_production', '살오징어 생산량 (톤)', '살오징어', '어획·양식'),
+    ('aquaculture', '김 생산량 (톤)', '김', '어획·양식'),
+    ('aquaculture', '미역 생산량 (톤)', '미역', '어획·양식'),
+    ('aquaculture', '굴 생산량 (톤)', '굴', '어획·양식'),
+    ('nutrition', '칼슘 섭취지수(%)', '칼슘 섭취', '영양'),
+    ('nutrition', '철 섭취지수(%)', '철 섭취', '영양'),
+    ('nutrition', '오메가3 섭취지수(%)', '오메가3 섭취', '영양'),
+)
+DATASETS = tuple(dict.fromkeys(name for name, _, _, _ in SERIES))
+STATS = ("n", "sa", "sb", "saa", "sbb", "sab")
+
+
+def align(observations, years=None):
+    # observations: 표시 이름 -> (연도 배열, 값 배열) -> (연도 축, 값 행렬, 표시 행렬)
+    # 관측값이 하나도 없는 계열은 모든 칸을 MISSING으로 둡니다.
+    labels = list(observations)
+    if years is None:
+        ranges = [(int(np.min(y)), int(np.max(y))) for y, _ in observations.values() if len(y)]
+        years = np.arange(min(a for a, _ in ranges), max(b for _, b in ranges) + 1) if ranges else np.arange(0)
+    values = np.full((len(years), len(labels)), np.nan)
+    flags = np.full(values.shape, MISSING, dtype=np.uint8)
+    for j, label in enumerate(labels):
+        obs_years, obs_values = observations[label]
+        if len(obs_years) == 0:
+            continue
+        order = np.argsort(obs_years)
+        obs_years = np.asarray(obs_years, dtype=np.float64)[order]
+        obs_values = np.asarray(obs_values, dtype=np.float64)[order]
+        inside = (years >= obs_years[0]) & (years <= obs_years[-1])
+        values[inside, j] = np.interp(years[inside], obs_years, obs_values)
+        flags[inside, j] = INTERPOLATED
+        flags[np.isin(years, obs_years), j] = OBSERVED
+    return years, labels, values, flags
+
+
+def _lag_rows(n_rows, lag, start=0):
+    # lag 쌍 (a, a + lag) 중 a 또는 a + lag가 start 이후인 a 행들
+    lo = max(0, -lag, start - max(lag, 0))
+    hi = min(n_rows, n_rows - lag)
+    return np.arange(lo, max(lo, hi))
+
+
+def _pair_sums(centered, mask, rows, lag):
+    a, b = rows, rows + lag
+    va, vb = centered[a], centered[b]
+    ma, mb = mask[a], mask[b]
+    return np.stack([ma.T @ mb, va.T @ mb, ma.T @ vb, (va * va).T @ mb, ma.T @ (vb * vb), va.T @ vb])
+
+
+class CrisisCube:
+    def __init__(self, years, labels, values, flags, max_lag=MAX_LAG, shift=None, _sums=None):
+        self.years = np.asarray(years)
+        self.labels = list(labels)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.flags = np.asarray(flags, dtype=np.uint8)
+        self.max_lag = max_lag
+        self.lags = np.arange(-max_lag, max_lag + 1)
+        # 계열마다 처음 만들 때의 평균을 빼고 더해 자릿수 손실을 줄입니다. (상관은 이동에 불변, 확장 때도 같은 값을 씁니다)
+        if shift is None:
+            present = ~np.isnan(self.values)
+            shift = np.where(present, self.values, 0.0).sum(axis=0) / np.maximum(present.sum(axis=0), 1)
+        self.shift = shift
+        self.sums = _sums if _sums is not None else {key: self._accumulate(key) for key in ("all", "observed")}
+        self._corr = {}
+
+    def _masked(self, key):
+        mask = ~np.isnan(self.values) if key == "all" else (self.flags == OBSERVED)
+        centered = np.where(mask, self.values - self.shift, 0.0)
+        return centered, mask.astype(np.float64)
+
+    def _accumulate(self, key, start=0, sums=None):
+        centered, mask = self._masked(key)
+        k = len(self.labels)
+        sums = np.zeros((len(self.lags), len(STATS), k, k)) if sums is None else sums
+        for i, lag in enumerate(self.lags):
+            rows = _lag_rows(len(self.years), lag, start)
+            if len(rows):
+                sums[i] += _pair_sums(centered, mask, rows, lag)
+        return sums
+
+    def _subtract(self, key, start, sums):
+        centered, mask = self._masked(key)
+        for i, lag in enumerate(self.lags):
+            rows = _lag_rows(len(self.years), lag, start)
+            if len(rows):
+                sums[i] -= _pair_sums(centered, mask, rows, lag)
+        return sums
+
+    def extended(self, years, labels, values, flags):
+        # 같은 시작 연도/계열에 연도가 늘거나 뒤쪽 값이 바뀐 새 행렬 -> 바뀐 행에 걸친 쌍만 다시 계산한 새 큐브
+        # (공유 캐시의 기존 큐브는 건드리지 않습니다) 앞쪽 값이 바뀌었거나 축이 다르면 처음부터 만듭니다.
+        years, values, flags = np.asarray(years), np.asarray(values, dtype=np.float64), np.asarray(flags, dtype=np.uint8)
+        n_old = len(self.years)
+        if list(labels) != self.labels or len(years) < n_old or not np.array_equal(years[:n_old], self.years):
+            return CrisisCube(years, labels, values, flags, self.max_lag)
+        same = np.all((values[:n_old] == self.values) | (np.isnan(values[:n_old]) & np.isnan(self.values)), axis=1)
+        same &= np.all(flags[:n_old] == self.flags, axis=1)
+        start = int(np.argmin(same)) if not same.all() else n_old
+        if start == 0:
+            return CrisisCube(years, labels, values, flags, self.max_lag)
+
+        sums = {}
+        for key, old in self.sums.items():
+            sums[key] = self._subtract(key, start, old.copy())
+        cube = CrisisCube(years, labels, values, flags, self.max_lag, shift=self.shift, _sums=sums)
+        for key in sums:
+            cube._accumulate(key, start, sums[key])
+        return cube
+
+    def lagged_corr(self, lag, observed_only=False):
+        # (계열 x 계열) 상관 행렬과 겹치는 해 수 행렬. [a, b]는 a(t)와 b(t + lag)의 상관입니다.
+        key = "observed" if observed_only else "all"
+        cached = self._corr.get((key, lag))
+        if cached is None:
+            n, sa, sb, saa, sbb, sab = self.sums[key][lag + self.max_lag]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                cov = n * sab - sa * sb
+                var = (n * saa - sa * sa) * (n * sbb - sb * sb)
+                corr = np.where((n >= MIN_OVERLAP) & (var > 0), cov / np.sqrt(var), np.nan)
+            cached = self._corr[(key, lag)] = (np.clip(corr, -1.0, 1.0), n.astype(np.int64))
+        return cached
+
+    def best_lag(self, a, b, observed_only=False, lags=None):
+        # |상관|이 가장 큰 시차 (없으면 None)
+        if a not in self.labels or b not in self.labels:
+            return None
+        i, j = self.labels.index(a), self.labels.index(b)
+        best = None
+        for lag in (self.lags if lags is None else lags):
+            corr, n = self.lagged_corr(int(lag), observed_only)
+            if not np.isnan(corr[i, j]) and (best is None or abs(corr[i, j]) > abs(best[1])):
+                best = (int(lag), float(corr[i, j]), int(n[i, j]))
+        return best
+
+    def _observed_rows(self, label):
+        if label not in self.labels:
+            return None, np.arange(0)
+        j = self.labels.index(label)
+        return j, np.flatnonzero(self.flags[:, j] == OBSERVED)
+
+    def latest(self, label):
+        # 마지막 관측 연도와 값 (관측값이 없으면 None)
+        j, observed = self._observed_rows(label)
+        if not len(observed):
+            return None
+        return int(self.years[observed[-1]]), float(self.values[observed[-1], j])
+
+    def change(self, label):
+        # 첫 관측 대비 마지막 관측의 변화 (연도, 연도, 변화량, 변화율) (관측값이 없으면 None)
+        j, observed = self._observed_rows(label)
+        if not len(observed):
+            return None
+        first, last = self.values[observed[0], j], self.values[observed[-1], j]
+        return int(self.years[observed[0]]), int(self.years[observed[-1]]), last - first, (last - first) / abs(first) if first else np.nan
+
+    def frame(self):
+        # 표시용 긴 표 (연도, 계열, 값, 보간 여부)
+        years = np.repeat(self.years, len(self.labels))
+        return pd.DataFrame({
+            '연도': years,
+            '계열': np.tile(self.labels, len(self.years)),
+            '값': self.values.ravel(),
+            '보간': self.flags.ravel() == INTERPOLATED,
+        }).dropna(subset=['값'])
+
+
+def observations(series=SERIES):
+    result = {}
+    for name, column, label, _ in series:
+        df = datasets.get(name)
+        valid = df[column].notna()
+        if not valid.any():
+            continue  # 데이터 파일의 열이 비어 있으면 그 계열은 빼고 만듭니다.
+        result[label] = (df.loc[valid, '연도'].to_numpy(), df.loc[valid, column].to_numpy())
+    return result
+
+
+def stage(label):
+    return next(s for _, _, l, s in SERIES if l == label)
+
+
+# 의존 데이터셋 버전이 바뀌면 새 큐브를 만들되, 이전 큐브가 있으면 extended()로 바뀐 부분만 다시 쌓습니다.
+_CACHE = {}
+_LOCK = threading.Lock()
+
+
+def cube():
+    key = tuple(datasets.version(name) for name in DATASETS)
+    with _LOCK:
+        cached = _CACHE.get('cube')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    with spans.span("crisis_cube"):
+        years, labels, values, flags = align(observations())
+        previous = cached[1] if cached is not None else None
+        result = previous.extended(years, labels, values, flags) if previous is not None else CrisisCube(years, labels, values, flags)
+    with _LOCK:
+        _CACHE['cube'] = (key, result)
+    return result
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+# --- 가상 데이터 생성기 ---
+# 지도에 쓰는 (연도, 국가) 격자를 파이썬 반복문 없이 NumPy 한 번의 배치 연산으로 만듭니다.
+# 같은 seed를 주면 항상 같은 결과가 나옵니다.
+# 데이터셋마다 별도의 난수 스트림을 쓰므로 한 데이터셋을 바꿔도 다른 데이터셋은 그대로입니다.
+
+# 생성 로직의 의미가 바뀌면 올려 주세요. (디스크 캐시 키에 포함됩니다)
+DATASET_VERSION = 1
+DEFAULT_SEED = 20240601
+
+COUNTRIES = ['USA', 'CHN', 'IND', 'RUS', 'JPN', 'DEU', 'KOR', 'CAN', 'BRA', 'AUS', 'IDN', 'MEX', 'SAU', 'GBR', 'FRA', 'ITA', 'NLD', 'BGD', 'VNM', 'EGY', 'NGA']
+MAP_START_YEAR = 1993
+MAP_END_YEAR = 2024
+GMSL_START_YEAR = 1993
+GMSL_END_YEAR = 2024
+
+_STREAM_GMSL, _STREAM_FACTORS, _STREAM_MAP = 0, 1, 2
+
+
+def _rng(seed, stream):
+    return np.random.default_rng(None if seed is None else [seed, stream])
+
+
+def generate_gmsl_df(start_year=GMSL_START_YEAR, end_year=GMSL_END_YEAR, seed=None):
+    rng = _rng(seed, _STREAM_GMSL)
+    years = np.arange(start_year, end_year + 1)
+    base_rise = np.linspace(0, 100, len(years))
+    seasonal_variation = 5 * np.sin(np.linspace(0, len(years)//2 * np.pi, len(years)))
+    noise = rng.normal(0, 1.5, len(years))
+    gmsl = base_rise + seasonal_variation + noise
+    return pd.DataFrame({'연도': years, '해수면 높이 (mm)': gmsl})
+
+
+def generate_factors_df(start_year=GMSL_START_YEAR, end_year=GMSL_END_YEAR, seed=None):
+    rng = _rng(seed, _STREAM_FACTORS)
+    years = np.arange(start_year, end_year + 1)
+    return pd.DataFrame({
+        '연도': years,
+        '열팽창': np.linspace(20, 42, len(years)) + rng.normal(0, 1, len(years)),
+        '빙하 융해': np.linspace(15, 25, len(years)) + rng.normal(0, 1, len(years)),
+        '그린란드/남극 빙상': np.linspace(10, 33, len(years)) + rng.normal(0, 1, len(years))
+    })
+
+
+def time_grid(start_year=MAP_START_YEAR, end_year=MAP_END_YEAR, freq="year"):
+    # freq='year'이면 연 단위, 'month'이면 월 단위 격자입니다.
+    years = np.arange(start_year, end_year + 1)
+    if freq == "year":
+        return years, None
+    if freq == "month":
+        return np.repeat(years, 12), np.tile(np.arange(1, 13), len(years))
+    raise ValueError(f"지원하지 않는 시간 해상도입니다: {freq} ('year' 또는 'month')")
+
+
+def generate_map_df(countries=None, start_year=MAP_START_YEAR, end_year=MAP_END_YEAR, freq="year", seed=None):
+    countries = list(COUNTRIES if countries is None else countries)
+    rng = _rng(seed, _STREAM_MAP)
+    years, months = time_grid(start_year, end_year, freq)
+    elapsed = (years - start_year).astype(np.float64)
+    if months is not None:
+        elapsed += (months - 1) / 12.0
+
+    n_time, n_countries = len(years), len(countries)
+    base_rates = rng.uniform(2.5, 5.5, n_countries)
+    yearly_growth = rng.uniform(0.01, 0.05, (n_time, n_countries))
+    rates = base_rates[np.newaxis, :] + elapsed[:, np.newaxis] * yearly_growth
+
+    # 행 순서는 기존 반복문과 같이 (시간, 국가) 순입니다.
+    columns = {'연도': np.repeat(years, n_countries)}
+    if months is not None:
+        columns['월'] = np.repeat(months, n_countries)
+    columns['country_iso'] = pd.Categorical.from_codes(
+        np.tile(np.arange(n_countries), n_time), categories=countries)
+    columns['rise_rate_mm_year'] = rates.ravel()
+    return pd.DataFrame(columns)
@@ -0,0 +1,96 @@
+import hashlib
+import os
+import threading
+
+import pandas as pd
+
+# --- 로컬 데이터 파일 ---
+# 표 데이터셋은 data/<이름>.parquet 또는 data/<이름>.csv 파일 하나씩에서 읽습니다. (parquet가 있으면 우선)
+# 읽을 때마다 그 데이터셋이 기대는 파일들의 (경로, mtime, 크기)와 내용 해시를 기억해 두고,
+# changed()는 mtime/크기가 달라진 데이터셋만 해시를 다시 계산해 내용이 실제로 바뀐 것만 돌려줍니다.
+# (파일을 저장만 하고 내용이 같으면 다시 읽지 않습니다) 캐시 무효화는 datasets.refresh()가 합니다.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+TABLE_FORMATS = (".parquet", ".csv")
+
+_files = {}  # 데이터셋 이름 -> 파일 경로 목록을 돌려주는 함수
+_seen = {}   # 데이터셋 이름 -> (stat 서명, 내용 해시)
+_lock = threading.Lock()
+
+
+def table_path(name, data_dir=DATA_DIR):
+    # 있는 파일 중 우선순위가 가장 높은 것 (없으면 .csv 경로)
+    for ext in TABLE_FORMATS:
+        path = os.path.join(data_dir, name + ext)
+        if os.path.exists(path):
+            return path
+    return os.path.join(data_dir, name + TABLE_FORMATS[-1])
+
+
+def _stat_signature(paths):
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            signature.append((path, None, None))
+        else:
+            signature.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _digest(paths):
+    h = hashlib.sha256()
+    for path in paths:
+        h.update(os.path.basename(path).encode())
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+        except FileNotFoundError:
+            h.update(b"\0missing")
+    return h.hexdigest()
+
+
+def track(name, files):
+    # name 데이터셋이 files()가 돌려주는 파일들에서 만들어진다고 기록합니다. 읽기 직전에 부릅니다.
+    # (읽는 도중에 파일이 바뀌면 다음 changed()에서 잡히도록 서명을 먼저 남깁니다)
+    paths = sorted(files())
+    with _lock:
+        _files[name] = files
+        _seen[name] = (_stat_signature(paths), _digest(paths))
+
+
+def read_table(name, data_dir=DATA_DIR):
+    track(name, lambda: [table_path(name, data_dir)])
+    path = table_path(name, data_dir)
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, encoding="utf-8")
+
+
+def changed():
+    # 마지막으로 읽은 뒤 내용이 바뀐 데이터셋 이름 목록
+    result = []
+    with _lock:
+        for name, files in _files.items():
+            paths = sorted(files())
+            signature = _stat_signature(paths)
+            old_signature, old_digest = _seen[name]
+            if signature == old_signature:
+                continue
+            digest = _digest(paths)
+            _seen[name] = (signature, digest)
+            if digest != old_digest:
+                result.append(name)
+    return result
+
+
+def status():
+    with _lock:
+        return [
+            {"dataset": name, "files": ", ".join(os.path.relpath(p, BASE_DIR) for p, _, _ in signature),
+             "mtime_ns": max((m or 0 for _, m, _ in signature), default=0), "sha256": digest[:12]}
+            for name, (signature, digest) in _seen.items()
+        ]
@@ -0,0 +1,303 @@
+import functools
+import hashlib
+import os
+import pickle
+import threading
+import time
+
+import pandas as pd
+
+import artifact_cache
+import data_gen
+import data_sources
+import geo_cache
+import gmsl_hires
+import spans
+from data_gen import (COUNTRIES, DATASET_VERSION, DEFAULT_SEED, generate_factors_df,
+                      generate_gmsl_df, generate_map_df)
+
+# --- 데이터셋 레지스트리 ---
+# 데이터셋마다 로더를 하나씩 등록하고, 탭이 실제로 그려질 때 get(name)으로 처음 한 번만 만듭니다.
+# 만들어진 값은 프로세스 안의 모든 세션이 공유하므로 읽기 전용으로 다뤄야 합니다.
+# (필터링이나 melt처럼 새 DataFrame을 만드는 연산은 괜찮지만, 제자리 수정은 안 됩니다.)
+# 표 데이터는 data/<이름>.csv에서 읽습니다. refresh()는 내용이 바뀐 파일의 데이터셋과 그것에 기대는
+# 데이터셋(deps)만 버전을 올려 다시 읽게 하고, on_invalidate()로 등록한 곳(그림 캐시)에 알립니다.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+KOREA_GEOJSON_PATH = os.path.join(BASE_DIR, 'skorea-provinces-2013-geo.json')
+
+WATCH_INTERVAL = float(os.environ.get("DASHBOARD_DATA_WATCH", 0))  # 초, 0이면 파일 감시를 하지 않습니다.
+
+_REGISTRY = {}
+_listeners = []
+_refresh_lock = threading.Lock()
+_changes = []  # (시각, 바뀐 데이터셋 이름들)
+_watcher = None
+
+
+class Dataset:
+    def __init__(self, name, loader, tabs, deps):
+        self.name = name
+        self.loader = loader
+        self.tabs = tabs
+        self.deps = deps
+        self.lock = threading.Lock()
+        # (값, generation) 또는 None. 한 번에 바꾸고 한 번에 읽으므로 잠금 없이 읽어도 invalidate() 도중에
+        # 값만 비워진 상태를 보지 않습니다. (캐시에 없다는 뜻의 None과 값이 None인 데이터셋을 구분합니다)
+        self.state = None
+        self.loads = 0
+        self.hits = 0
+        self.load_seconds = 0.0
+        self.nbytes = 0
+        self.generation = 0
+        self.digest = None  # (generation, 내용 해시)
+
+
+def register(name, tabs=(), deps=()):
+    # deps: 이 데이터셋을 만들 때 읽는 다른 데이터셋 (그쪽이 바뀌면 이것도 다시 만듭니다)
+    def decorator(loader):
+        _REGISTRY[name] = Dataset(name, loader, tabs, deps)
+        return loader
+    return decorator
+
+
+def _nbytes(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def get(name):
+    return _get(name)[0]
+
+
+def _get(name):
+    # (값, 그 값을 만든 generation)
+    ds = _REGISTRY[name]
+    state = ds.state
+    if state is not None:
+        ds.hits += 1
+        return state
+    with ds.lock:
+        # 여러 세션이 동시에 요청해도 로더는 한 번만 실행됩니다.
+        state = ds.state
+        if state is None:
+            start = time.perf_counter()
+            with spans.span(f"load:{name}", "data") as span:
+                value = ds.loader()
+                ds.load_seconds = time.perf_counter() - start
+                ds.nbytes = _nbytes(value)
+                span.set(nbytes=ds.nbytes)
+            ds.loads += 1
+            state = ds.state = (value, ds.generation)
+            return state
+    ds.hits += 1
+    return state
+
+
+def dependents(name):
+    # name과, name에 직접/간접으로 기대는 데이터셋 이름들
+    result = [name]
+    for current in result:
+        result.extend(n for n, ds in _REGISTRY.items() if current in ds.deps and n not in result)
+    return result
+
+
+def invalidate(name=None):
+    names = dependents(name) if name else list(_REGISTRY)
+    for n in names:
+        ds = _REGISTRY[n]
+        with ds.lock:
+            ds.generation += 1
+            ds.state = None
+    for n in names:
+        for listener in _listeners:
+            listener(n)
+    return names
+
+
+def on_invalidate(listener):
+    # listener(name)은 데이터셋이 무효화될 때마다 불립니다. (예: 그 데이터셋에 기대는 그림 지우기)
+    _listeners.append(listener)
+
+
+def refresh():
+    # 파일 내용이 바뀐 데이터셋만 무효화합니다. 무효화된 이름 목록을 돌려줍니다.
+    with _refresh_lock:
+        names = []
+        for name in data_sources.changed():
+            names.extend(n for n in invalidate(name) if n not in names)
+        if names:
+            _changes.append((time.time(), tuple(names)))
+        return names
+
+
+def change_count():
+    # 세션이 마지막으로 본 값과 비교해 새 데이터가 들어왔는지 알아내는 데 씁니다.
+    return len(_changes)
+
+
+def changes():
+    return list(_changes)
+
+
+def start_watcher(interval=WATCH_INTERVAL):
+    # interval초마다 refresh()를 부르는 데몬 스레드 (프로세스당 하나)
+    global _watcher
+    with _refresh_lock:
+        if _watcher is not None or interval <= 0:
+            return _watcher
+
+        def watch():
+            while True:
+                time.sleep(interval)
+                refresh()
+
+        _watcher = threading.Thread(target=watch, name="dataset-watcher", daemon=True)
+        _watcher.start()
+        return _watcher
+
+
+def version(name):
+    # 그림 캐시 등 파생 결과의 키로 쓰는 데이터셋 버전 문자열입니다.
+    return f"{name}:{DATASET_VERSION}:{DEFAULT_SEED}:{_REGISTRY[name].generation}"
+
+
+def fingerprint(name):
+    # 데이터셋 내용의 해시 - version()과 달리 프로세스가 달라도 내용이 같으면 같습니다. (디스크에 저장한 그림의 키)
+    ds = _REGISTRY[name]
+    value, generation = _get(name)
+    if ds.digest is None or ds.digest[0] != generation:
+        ds.digest = (generation, hashlib.sha256(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest())
+    return ds.digest[1]
+
+
+def names(tab=None):
+    return [n for n, ds in _REGISTRY.items() if tab is None or tab in ds.tabs]
+
+
+def stats():
+    return [
+        {
+            "dataset": ds.name,
+            "tabs": ", ".join(ds.tabs),
+            "loaded": ds.state is not None,
+            "loads": ds.loads,
+            "hits": ds.hits,
+            "load_ms": round(ds.load_seconds * 1000, 2),
+            "bytes": ds.nbytes,
+        }
+        for ds in _REGISTRY.values()
+    ]
+
+
+# 가상 데이터 생성 함수들. "datasets" 아티팩트는 모두 이 목록과 data_gen 전체로 만든 지문 하나를 씁니다.
+# (evict_stale이 지문이 다른 파일을 지우므로 데이터셋마다 지문을 따로 두면 서로의 파일을 지웁니다)
+GENERATORS = (generate_gmsl_df, generate_factors_df, generate_map_df)
+
+
+def _generated(name, build, *args, **kwargs):
+    # build(*args, **kwargs)의 결과를 인자/버전/생성 코드 지문으로 디스크에 저장해 모든 워커가 공유합니다.
+    # COUNTRIES, 연도 범위, seed 같은 인자나 생성 코드를 바꾸면 키가 달라져 다시 만듭니다.
+    if build not in GENERATORS:
+        raise ValueError(f"GENERATORS에 없는 생성 함수입니다: {build.__name__}")
+    return artifact_cache.load_or_build(
+        "datasets",
+        {"name": name, "build": build.__name__, "args": args, "kwargs": kwargs, "version": DATASET_VERSION},
+        lambda: build(*args, **kwargs),
+        fingerprint=_generated_fingerprint(),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _generated_fingerprint():
+    return artifact_cache.code_fingerprint(data_gen, *GENERATORS)
+
+
+@register("gmsl_hires", tabs=("tab1",))
+def load_gmsl_hires():
+    # data/gmsl/의 고해상도 관측 자료 (없으면 None)
+    data_sources.track("gmsl_hires", gmsl_hires.source_files)
+    return gmsl_hires.load()
+
+
+@register("gmsl", tabs=("tab1", "tab4"), deps=("gmsl_hires",))
+def load_gmsl():
+    # 고해상도 관측 자료가 있으면 그 연평균을 연간 시계열로 씁니다.
+    hires = get("gmsl_hires")
+    if hires is not None:
+        return gmsl_hires.annual_means(hires)
+    # 1. 해수면 데이터 (GMSL) 생성 - 2020년 기준 높이로 맞춰 둡니다.
+    gmsl_df = _generated("gmsl", generate_gmsl_df, seed=DEFAULT_SEED)
+    baseline_2020_level = gmsl_df[gmsl_df['연도'] == 2020]['해수면 높이 (mm)'].iloc[0]
+    gmsl_df['해수면 높이 (mm)'] = gmsl_df['해수면 높이 (mm)'] - baseline_2020_level
+    return gmsl_df
+
+
+@register("factors", tabs=("tab1",))
+def load_factors():
+    # 2. 해수면 상승 기여 요인 데이터 생성
+    return _generated("factors", generate_factors_df, seed=DEFAULT_SEED)
+
+
+@register("map", tabs=("tab1",))
+def load_map():
+    # 3. 지도 데이터 생성 (연도별)
+    return _generated("map", generate_map_df, COUNTRIES, 1993, 2024, seed=DEFAULT_SEED)
+
+
+@register("nutrition", tabs=("tab3",))
+def load_nutrition():
+    # 4. 영양 섭취 데이터
+    return data_sources.read_table("nutrition")
+
+
+@register("plastic", tabs=("tab3",))
+def load_plastic():
+    # 5. 플라스틱 쓰레기 데이터
+    return data_sources.read_table("plastic")
+
+
+@register("debris", tabs=("tab3",))
+def load_debris():
+    # 6. 전체 해양 쓰레기 데이터
+    return data_sources.read_table("debris")
+
+
+@register("fish_production", tabs=("tab3",))
+def load_fish_production():
+    # 7. 어획량 데이터
+    return data_sources.read_table("fish_production")
+
+
+@register("aquaculture", tabs=("tab3",))
+def load_aquaculture():
+    # 8. 양식 생산량 데이터
+    return data_sources.read_table("aquaculture")
+
+
+@register("ghg", tabs=("tab1",))
+def load_ghg():
+    # 9. 온실가스 데이터
+    return data_sources.read_table("ghg")
+
+
+@register("regional_fishery", tabs=("tab2",))
+def load_regional_fishery():
+    # 10. 대한민국 지역별 어획량 데이터 - 파일은 도시별 열(wide)이고 시도 단위로 합칩니다.
+    df_wide = data_sources.read_table("regional_fishery")
+    df_long = df_wide.melt(id_vars='연도', var_name='도시', value_name='어획량_톤')
+    region_map = {
+        '여수': '전라남도', '부산': '부산광역시', '목포': '전라남도', '통영': '경상남도',
+        '인천': '인천광역시', '군산': '전라북도', '울산': '울산광역시'
+    }
+    df_long['지역'] = df_long['도시'].map(region_map)
+    regional_fishery_df = df_long.groupby(['연도', '지역'])['어획량_톤'].sum().reset_index()
+    return regional_fishery_df
+
+
+@register("korea_geo", tabs=("tab2",))
+def load_korea_geo():
+    # 대한민국 지도 - 허용 오차별 단순화 도형, bbox, 지역 이름 색인 (geo_cache.GeoCache)
+    data_sources.track("korea_geo", lambda: [KOREA_GEOJSON_PATH])
+    return geo_cache.load(KOREA_GEOJSON_PATH)
@@ -0,0 +1,75 @@
+import numpy as np
+
+# --- 그래프용 시계열 다운샘플링 ---
+# 브라우저로 보내는 점 수를 구간과 상관없이 MAX_POINTS 이하로 유지합니다.
+# 구간 안의 점이 예산보다 적으면(좁게 확대한 경우) 원본을 그대로 보냅니다.
+#   - lttb: Largest-Triangle-Three-Buckets, 선 모양을 가장 잘 보존합니다.
+#   - minmax: 버킷마다 최솟값/최댓값을 남겨 극값(폭풍 해일 등)을 놓치지 않습니다.
+
+MAX_POINTS = 1500
+MARKER_MAX_POINTS = 120  # 이보다 점이 많으면 마커 없이 선만 그립니다.
+
+
+def _bucket_edges(n, n_buckets):
+    # 첫 점과 끝 점을 제외한 가운데 점을 n_buckets개 버킷으로 나눕니다.
+    return np.linspace(1, n - 1, n_buckets + 1).astype(np.int64)
+
+
+def lttb(x, y, n_out):
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = _bucket_edges(n, n_out - 2)
+    # 다음 버킷의 평균점은 선택 결과와 무관하므로 미리 한 번에 계산합니다.
+    cx = np.concatenate([[0.0], np.cumsum(x)])
+    cy = np.concatenate([[0.0], np.cumsum(y)])
+    next_lo = np.append(edges[1:-1], n - 1)
+    next_hi = np.append(edges[2:], n)
+    avg_x = (cx[next_hi] - cx[next_lo]) / (next_hi - next_lo)
+    avg_y = (cy[next_hi] - cy[next_lo]) / (next_hi - next_lo)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        area = np.abs((x[a] - avg_x[b]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y[b] - y[a]))
+        a = lo + int(area.argmax())
+        selected[b + 1] = a
+    return selected
+
+
+def minmax(x, y, n_out):
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+    edges = _bucket_edges(n, (n_out - 2) // 2)
+    starts = edges[:-1]
+    # 버킷별 최솟값/최댓값 위치를 reduceat으로 한 번에 구합니다.
+    lo_val = np.minimum.reduceat(y[:n - 1], starts)
+    hi_val = np.maximum.reduceat(y[:n - 1], starts)
+    bucket = np.repeat(np.arange(len(starts)), np.diff(edges))
+    body = np.arange(1, n - 1)
+    is_min = y[body] == lo_val[bucket]
+    is_max = y[body] == hi_val[bucket]
+    first_min = body[is_min][np.unique(bucket[is_min], return_index=True)[1]]
+    first_max = body[is_max][np.unique(bucket[is_max], return_index=True)[1]]
+    return np.unique(np.concatenate([[0, n - 1], first_min, first_max]))
+
+
+METHODS = {"lttb": lttb, "minmax": minmax}
+
+
+def downsample(x, y, max_points=MAX_POINTS, method="lttb"):
+    # (x, y)를 최대 max_points개로 줄입니다. 줄일 필요가 없으면 입력 배열을 그대로 돌려줍니다.
+    if len(x) <= max_points:
+        return x, y
+    index = METHODS[method](x, y, max_points)
+    return np.asarray(x)[index], np.asarray(y)[index]
+
+
+def line_mode(n_points):
+    return 'lines+markers' if n_points <= MARKER_MAX_POINTS else 'lines'
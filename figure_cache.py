@@ -0,0 +1,196 @@
+import functools
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from importlib import metadata
+
+from plotly.basedatatypes import BaseFigure
+
+import artifact_cache
+import datasets
+import spans
+
+# --- Plotly 그림 캐시 ---
+# (그림 id, 그림에 영향을 주는 위젯 값, 의존 데이터셋 버전)을 키로 그림을 JSON으로 직렬화했다가 다시 읽은 dict를 보관합니다.
+# 입력이 바뀌지 않은 그림은 px/go 객체를 다시 만들거나 JSON을 다시 읽지 않고 저장된 dict를 st.plotly_chart에 넘깁니다.
+# 모든 세션이 같은 dict를 공유하므로 읽기 전용으로 다뤄야 합니다. (Streamlit은 전송용으로 한 번 직렬화만 합니다)
+# dict를 그대로 넘기면 Streamlit이 go.Figure로 다시 검증하므로, 설치된 Plotly가 Figure 객체를 검증 없이 to_dict()만
+# 부르는 것이 확인되면(_passes_through) CachedFigure로 감싸 넘기고, 아니면 dict 그대로 넘깁니다.
+# 전체 크기가 예산을 넘으면 가장 오래 쓰이지 않은 그림부터 버립니다. (LRU)
+# 메모리에 없으면 디스크(.cache/figures/)에 저장된 그림을 찾아봅니다. 디스크 키는 데이터셋 버전 대신
+# 내용 해시(datasets.fingerprint)와 프로젝트 코드/Plotly 버전 지문을 쓰므로 새 프로세스에서도 그대로 맞습니다.
+# 디스크에는 PERSIST가 켜졌을 때만 씁니다. (prewarm.py가 기본 화면의 그림을 저장할 때)
+
+MAX_BYTES = int(os.environ.get("DASHBOARD_FIGURE_CACHE_BYTES", 64 * 1024 * 1024))
+PERSIST = os.environ.get("DASHBOARD_FIGURE_PERSIST") == "1"
+
+
+class CachedFigure(BaseFigure):
+    # 검증을 마친 그림 dict를 담기만 하는 Figure입니다. BaseFigure.__init__을 부르지 않으므로 to_dict() 말고는 쓸 수 없고,
+    # _passes_through()가 확인한 경로(plotly.tools.return_figure_from_figure_or_data)에서만 씁니다.
+    # (plotly.basedatatypes는 Streamlit이 테마를 등록할 때 이미 불러 둡니다)
+    def __init__(self, spec):
+        self._spec = spec
+
+    def to_dict(self):
+        return self._spec
+
+
+@functools.lru_cache(maxsize=1)
+def _passes_through():
+    # st.plotly_chart가 쓰는 변환 함수가 Figure 객체의 to_dict() 결과를 검증 없이 그대로 돌려주는지 확인합니다.
+    # Plotly/Streamlit 버전이 바뀌어 다른 속성을 쓰거나 다시 검증하면 False가 되어 dict를 그대로 넘깁니다.
+    try:
+        import plotly.io
+        import plotly.tools
+        spec = {"data": [{"type": "scatter", "y": [1]}], "layout": {}}
+        figure = plotly.tools.return_figure_from_figure_or_data(CachedFigure(spec), validate_figure=True)
+        return figure is spec and bool(plotly.io.to_json(figure, validate=False))
+    except Exception:
+        return False
+
+
+def _for_chart(spec):
+    return CachedFigure(spec) if _passes_through() else spec
+
+
+class FigureCache:
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (그림 dict, JSON 크기, 만드는 데 걸린 시간)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.build_seconds = 0.0
+        self.saved_seconds = 0.0
+        self.disk_hits = 0
+        self.persist = PERSIST
+
+    def get_or_build(self, fig_id, inputs, build, deps=()):
+        with spans.span(f"figure:{fig_id}", "figure") as span:
+            return self._get_or_build(fig_id, inputs, build, deps, span)
+
+    def _get_or_build(self, fig_id, inputs, build, deps, span):
+        key = (fig_id, _freeze(inputs), tuple(datasets.version(name) for name in deps))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.saved_seconds += entry[2]
+        if entry is not None:
+            span.set(payload=entry[1], cache="hit")
+            return _for_chart(entry[0])
+
+        path = _persisted_path(fig_id, inputs, deps)
+        text = _read_text(path)
+        if text is not None:
+            span.set(payload=len(text), cache="disk")
+            spec = json.loads(text)
+            with self._lock:
+                self.disk_hits += 1
+                self._store(key, spec, len(text), 0.0)
+            return _for_chart(spec)
+
+        start = time.perf_counter()
+        with spans.span(f"build:{fig_id}", "figure"):
+            fig = build()
+        with spans.span(f"to_json:{fig_id}", "figure"):
+            # JSON을 거치면 numpy 배열이 base64 typed array로 바뀌어 작아지고, 세션 사이에 공유해도 되는 순수 dict가 됩니다.
+            text = fig.to_json()
+            spec = json.loads(text)
+        elapsed = time.perf_counter() - start
+        span.set(payload=len(text), cache="miss")
+        with self._lock:
+            self.misses += 1
+            self.build_seconds += elapsed
+            self._store(key, spec, len(text), elapsed)
+        if self.persist:
+            artifact_cache.write_atomic(path, text.encode("utf-8"))
+        return _for_chart(spec)
+
+    def _store(self, key, spec, nbytes, elapsed):
+        # 크기 예산은 JSON 길이로 셉니다.
+        if key not in self._entries and nbytes <= self.max_bytes:
+            self._entries[key] = (spec, nbytes, elapsed)
+            self.bytes += nbytes
+            while self.bytes > self.max_bytes:
+                _, (_, old_bytes, _) = self._entries.popitem(last=False)
+                self.bytes -= old_bytes
+                self.evictions += 1
+
+    def invalidate(self, fig_id=None, dep=None):
+        # 그림 id나 의존 데이터셋 이름으로 골라서 지웁니다. 둘 다 없으면 전부 지웁니다.
+        with self._lock:
+            for key in list(self._entries):
+                if fig_id is not None and key[0] != fig_id:
+                    continue
+                if dep is not None and not any(v.startswith(f"{dep}:") for v in key[2]):
+                    continue
+                _, nbytes, _ = self._entries.pop(key)
+                self.bytes -= nbytes
+
+    def stats(self):
+        with self._lock:
+            # 디스크에서 읽은 그림도 새로 만들지 않았으므로 적중으로 셉니다.
+            requests = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.disk_hits) / requests, 3) if requests else 0.0,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "build_ms": round(self.build_seconds * 1000, 1),
+                "saved_ms": round(self.saved_seconds * 1000, 1),
+            }
+
+
+@functools.lru_cache(maxsize=1)
+def code_fingerprint():
+    # 그림 생성 코드가 여러 모듈에 걸쳐 있으므로 프로젝트 최상위 .py 전체와 Plotly 버전으로 지문을 만듭니다.
+    digest = hashlib.sha256(metadata.version("plotly").encode())
+    for path in sorted(glob.glob(os.path.join(artifact_cache.BASE_DIR, "*.py"))):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _persisted_path(fig_id, inputs, deps):
+    parts = {"id": fig_id, "inputs": _freeze(inputs), "deps": {name: datasets.fingerprint(name) for name in deps}}
+    return artifact_cache.artifact_path("figures", parts, fingerprint=code_fingerprint(), suffix=".json")
+
+
+def _read_text(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8")
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if hasattr(value, "item"):
+        return value.item()  # numpy 스칼라
+    return value
+
+
+_cache = FigureCache()
+get_or_build = _cache.get_or_build
+invalidate = _cache.invalidate
+stats = _cache.stats
+
+# 데이터 파일이 바뀌어 데이터셋이 무효화되면 그 데이터셋에 기대는 그림만 지웁니다.
+datasets.on_invalidate(lambda name: invalidate(dep=name))
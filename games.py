@@ -0,0 +1,147 @@
+import random
+
+import streamlit as st
+
+# --- 탭 5 게임 (상태 기계) ---
+# 세션마다 남기는 상태는 "고른 선택지/뽑은 카드의 번호"를 담은 짧은 bytes 하나뿐이고,
+# 단계·턴·점수·내역 문자열은 그 번호열과 모듈 상수(시나리오, 카드 덱)에서 그때그때 계산합니다.
+# 버튼은 on_click 콜백으로 상태만 바꾸고, 각 게임은 @st.fragment 안에서 그려지므로
+# 클릭하면 해당 게임 조각만 다시 실행됩니다. (st.rerun으로 대시보드 전체를 다시 돌리지 않습니다)
+
+MAYOR_START_SCORE = 50
+MAYOR_SCENARIOS = (
+    ("해수면이 10cm 상승했습니다. 주민들이 불안해합니다. 무엇을 하시겠습니까?", (("방파제 건설 (예산 감소, 안정 ↑)", 10), ("예산 절약 (주민 불만 ↑)", -15))),
+    ("바닷속에서 미세플라스틱이 발견되었습니다. 대응책은?", (("플라스틱 규제 정책 시행 (환경 개선 ↑)", 20), ("무시 (환경 악화 ↓)", -20))),
+    ("해변에 쓰레기가 쌓였습니다. 처리 방법을 선택하세요.", (("대규모 정화 활동 (지속가능 지수 ↑)", 15), ("그냥 둔다 (관광객 감소 ↓)", -10))),
+    ("도시 근처 공장에서 화학물질이 바다로 흘러 들어가고 있습니다.", (("엄격한 환경 규제 시행 (환경 ↑, 예산 ↓)", 15), ("규제 완화 (경제 유지, 환경 악화 ↓)", -15))),
+    ("해안가의 산호초가 백화되고 있습니다. 조치를 선택하세요.", (("산호 복원 프로젝트 지원 (환경 ↑, 예산 ↓)", 20), ("무시 (관광객 감소 ↓)", -10))),
+    ("도시의 바닷가에 오염된 어류가 발견되었습니다. 어떻게 대응하시겠습니까?", (("어류 회수 및 청소 (환경 개선 ↑)", 15), ("그냥 판매 허용 (경제 유지, 환경 악화 ↓)", -15))),
+    ("전세계적으로 기후 변화로 폭풍과 홍수가 잦아지고 있습니다.", (("재해 대비 방재 시스템 구축 (주민 안전 ↑)", 20), ("대책 없음 (주민 피해 ↑)", -20))),
+)
+MAYOR_RESULTS = (
+    (90, "success", "🌟 훌륭합니다! 도시는 안전하고 해양 환경이 잘 보존되었습니다."),
+    (70, "success", "🙂 도시는 대체로 안정적이며 환경도 어느 정도 보호되었습니다."),
+    (50, "warning", "😐 도시가 간신히 버티고 있습니다. 더 많은 노력이 필요합니다."),
+    (None, "error", "💀 도시가 해수면 상승과 환경오염에 무너졌습니다..."),
+)
+
+CARD_START_SCORE = 50
+CARD_TURNS = 7
+# (카드, 점수 변화, 종류) - 모든 세션이 같은 덱을 공유합니다.
+CARDS = (
+    ("🌱 재활용 캠페인", 10, "정책"), ("🚯 해변 청소", 15, "정책"), ("🏭 규제 완화", -10, "정책"),
+    ("🛑 플라스틱 금지", 20, "정책"), ("💸 환경 예산 삭감", -20, "정책"), ("🌳 해양 보호 구역 지정", 25, "정책"),
+    ("🌊 폭풍 해일 발생", -15, "재난"), ("🔥 해양 산불 발생", -20, "재난"), ("🐟 해양 생물 번식 성공", 20, "자연"),
+    ("🦀 산호초 회복", 15, "자연"), ("⚡ 태풍 피해", -25, "재난"), ("☀️ 강수량 증가로 수질 개선", 10, "자연"),
+)
+CARD_RESULTS = (
+    (90, "success", "🌟 지속가능한 도시 완성!"),
+    (70, "success", "🙂 도시가 안정적이며 환경이 잘 관리되었습니다."),
+    (50, "warning", "😐 도시가 간신히 유지됩니다."),
+    (None, "error", "💀 도시가 붕괴했습니다... 환경 관리 실패!"),
+)
+
+
+# --- 상태 전이 (순수 함수) ---
+def mayor_score(choices):
+    return MAYOR_START_SCORE + sum(MAYOR_SCENARIOS[stage][1][option][1] for stage, option in enumerate(choices))
+
+
+def mayor_choose(choices, option):
+    if len(choices) >= len(MAYOR_SCENARIOS):
+        return choices
+    return choices + bytes([option])
+
+
+def card_score(draws):
+    return CARD_START_SCORE + sum(CARDS[i][1] for i in draws)
+
+
+def card_draw(draws, rng=random):
+    if len(draws) >= CARD_TURNS:
+        return draws
+    return draws + bytes([rng.randrange(len(CARDS))])
+
+
+def card_history(draws):
+    for turn, i in enumerate(draws, start=1):
+        card, effect, category = CARDS[i]
+        yield f"{turn}턴: {category} 카드 - {card} ({effect:+})"
+
+
+def outcome(score, results):
+    for threshold, kind, message in results:
+        if threshold is None or score >= threshold:
+            return kind, message
+
+
+# --- 콜백 ---
+def _on_mayor_choose(option):
+    st.session_state.mayor_choices = mayor_choose(st.session_state.mayor_choices, option)
+
+
+def _on_mayor_restart():
+    st.session_state.mayor_choices = b""
+
+
+def _on_card_draw():
+    st.session_state.card_game_draws = card_draw(st.session_state.card_game_draws)
+
+
+def _on_card_restart():
+    st.session_state.card_game_draws = b""
+
+
+def _show(kind, message):
+    getattr(st, kind)(message)
+
+
+# --- 화면 ---
+@st.fragment
+def mayor_game():
+    st.header("🌊 해수면 상승 & 바다오염 시뮬레이션")
+    st.write("당신은 해안 도시의 시장입니다. 도시를 지켜내고, 바다를 보호하세요!")
+    choices = st.session_state.setdefault("mayor_choices", b"")
+
+    if len(choices) < len(MAYOR_SCENARIOS):
+        text, options = MAYOR_SCENARIOS[len(choices)]
+        st.subheader(text)
+        for i, (label, _) in enumerate(options):
+            st.button(label, key=f"mayor_option_{len(choices)}_{i}", on_click=_on_mayor_choose, args=(i,))
+    else:
+        score = mayor_score(choices)
+        st.subheader("📊 최종 결과")
+        st.write(f"당신의 지속가능 지수는 **{score}점** 입니다.")
+        _show(*outcome(score, MAYOR_RESULTS))
+        st.button("🔄 다시 시작", key="mayor_restart", on_click=_on_mayor_restart)
+
+
+@st.fragment
+def card_game():
+    st.header("🃏 환경 정책 카드 게임")
+    st.write("카드를 뽑아 도시의 환경 점수를 관리하세요!\n정책 카드와 자연/재난 카드가 랜덤으로 등장합니다.")
+    draws = st.session_state.setdefault("card_game_draws", b"")
+
+    if len(draws) < CARD_TURNS:
+        st.button("🃏 카드 뽑기", key="card_game_draw", on_click=_on_card_draw)
+    if draws:
+        card, effect, category = CARDS[draws[-1]]
+        if effect > 0:
+            st.success(f"✅ {card} ({category} 카드) 뽑음! 점수 {effect:+}")
+        else:
+            st.error(f"⚠️ {card} ({category} 카드) 뽑음! 점수 {effect:+}")
+
+    st.metric("환경 점수", card_score(draws))
+    st.write(f"🔹 뽑은 카드 수: {len(draws)} / 최대 {CARD_TURNS}턴")
+
+    if draws:
+        with st.expander("📜 카드 뽑은 내역 보기"):
+            for line in reversed(list(card_history(draws))):
+                st.write(line)
+
+    if len(draws) >= CARD_TURNS:
+        score = card_score(draws)
+        st.subheader("📊 최종 결과")
+        st.write(f"최종 환경 점수: **{score}**")
+        _show(*outcome(score, CARD_RESULTS))
+        st.button("🔄 다시 시작", key="card_game_restart", on_click=_on_card_restart)
@@ -0,0 +1,181 @@
+import csv
+import json
+import os
+import sys
+
+import numpy as np
+
+# --- GDP 컬럼형 저장소 ---
+# data/gdp_data.csv(연도별 열이 있는 World Bank 원본)를 한 번만 읽어서
+#   values.npy : float64 (연도 x 국가) 행렬, 한 연도가 연속된 한 행
+#   codes.npy  : 국가 코드 사전 (정렬된 고정폭 바이트 배열, 열 순서와 동일)
+#   meta.json  : 연도, 국가 이름, 지표 이름, 원본 파일 정보
+# 로 저장합니다. 읽을 때는 np.load(mmap_mode='r')만 하므로 콜드 스타트 비용이 거의 없고,
+# 여러 Streamlit 워커가 같은 페이지 캐시를 공유하므로 메모리도 늘어나지 않습니다.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CSV = os.path.join(BASE_DIR, "data", "gdp_data.csv")
+DEFAULT_STORE = os.path.join(BASE_DIR, "data", "gdp_store")
+
+STORE_FORMAT = 1
+_AGGREGATES = ("sum", "mean", "min", "max", "count")
+_AGGREGATE_AXES = ("countries", "years")
+
+
+def _source_info(csv_path):
+    st = os.stat(csv_path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _atomic_save(path, write):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def ingest(csv_path=DEFAULT_CSV, store_dir=DEFAULT_STORE):
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        year_cols = [i for i, name in enumerate(header) if name.strip().isdigit()]
+        years = [int(header[i]) for i in year_cols]
+        rows = []
+        for row in reader:
+            if len(row) < 2 or not row[1]:
+                continue
+            values = [float(row[i]) if i < len(row) and row[i] != "" else np.nan for i in year_cols]
+            rows.append((row[1], row[0], row[2], values))
+
+    # 국가 코드 순으로 정렬해 두면 코드 사전의 위치가 곧 열 번호가 됩니다.
+    rows.sort(key=lambda r: r[0])
+    codes = np.array([r[0] for r in rows], dtype="S3")
+    values = np.array([r[3] for r in rows], dtype=np.float64).T
+    values = np.ascontiguousarray(values)
+    indicators = sorted({r[2] for r in rows})
+
+    meta = {
+        "format": STORE_FORMAT,
+        "years": years,
+        "names": [r[1] for r in rows],
+        "indicator": indicators[0] if len(indicators) == 1 else indicators,
+        "source": _source_info(csv_path),
+    }
+
+    os.makedirs(store_dir, exist_ok=True)
+    _atomic_save(os.path.join(store_dir, "values.npy"), lambda f: np.save(f, values))
+    _atomic_save(os.path.join(store_dir, "codes.npy"), lambda f: np.save(f, codes))
+    # meta.json을 마지막에 써서 "적재 완료" 표시로 사용합니다.
+    _atomic_save(os.path.join(store_dir, "meta.json"),
+                 lambda f: f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8")))
+    return store_dir
+
+
+def _is_fresh(csv_path, store_dir):
+    meta_path = os.path.join(store_dir, "meta.json")
+    if not os.path.exists(meta_path):
+        return False
+    with open(meta_path, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("format") != STORE_FORMAT:
+        return False
+    if not os.path.exists(csv_path):
+        # 원본 CSV 없이 저장소만 배포된 경우에도 그대로 사용합니다.
+        return True
+    return meta.get("source") == _source_info(csv_path)
+
+
+def open_store(csv_path=DEFAULT_CSV, store_dir=DEFAULT_STORE):
+    if not _is_fresh(csv_path, store_dir):
+        ingest(csv_path, store_dir)
+    return GdpStore(store_dir)
+
+
+class GdpStore:
+    def __init__(self, store_dir=DEFAULT_STORE):
+        with open(os.path.join(store_dir, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.store_dir = store_dir
+        self.indicator = meta["indicator"]
+        self.names = meta["names"]
+        self.years = np.asarray(meta["years"], dtype=np.int64)
+        self.codes = np.load(os.path.join(store_dir, "codes.npy"), mmap_mode="r")
+        self.values = np.load(os.path.join(store_dir, "values.npy"), mmap_mode="r")
+
+    @property
+    def country_codes(self):
+        return [c.decode("ascii") for c in self.codes]
+
+    def year_slice(self, start=None, end=None):
+        # 연도는 정렬되어 있으므로 이진 탐색으로 행 범위를 찾습니다. (end 포함)
+        lo = 0 if start is None else int(np.searchsorted(self.years, start, side="left"))
+        hi = len(self.years) if end is None else int(np.searchsorted(self.years, end, side="right"))
+        return slice(lo, hi)
+
+    def positions(self, countries):
+        if isinstance(countries, str):
+            countries = [countries]
+        keys = np.asarray([c.encode("ascii") for c in countries], dtype="S3")
+        pos = np.searchsorted(self.codes, keys)
+        pos = np.minimum(pos, len(self.codes) - 1)
+        missing = self.codes[pos] != keys
+        if missing.any():
+            raise KeyError(f"알 수 없는 국가 코드: {[c for c, m in zip(countries, missing) if m]}")
+        return pos
+
+    def _country_index(self, countries):
+        if countries is None:
+            return slice(None)
+        pos = self.positions(countries)
+        if len(pos) == 1:
+            return int(pos[0])
+        # 연속된 코드 구간이면 슬라이스로 바꿔 복사 없는 뷰를 돌려줍니다.
+        if np.array_equal(pos, np.arange(pos[0], pos[0] + len(pos))):
+            return slice(int(pos[0]), int(pos[0]) + len(pos))
+        return pos
+
+    def select(self, countries=None, start=None, end=None):
+        # 국가 전체, 국가 하나, 연속된 국가 구간은 mmap 위의 뷰입니다.
+        # 흩어진 국가 목록만 fancy indexing 때문에 복사가 일어납니다.
+        rows = self.year_slice(start, end)
+        return self.years[rows], self.values[rows, self._country_index(countries)]
+
+    def aggregate(self, how="sum", countries=None, start=None, end=None, over="countries"):
+        # 데이터를 복사하지 않고 where 마스크로 결측치와 국가 선택을 함께 처리합니다.
+        if how not in _AGGREGATES:
+            raise ValueError(f"지원하지 않는 집계입니다: {how} (가능: {', '.join(_AGGREGATES)})")
+        if over not in _AGGREGATE_AXES:
+            raise ValueError(f"지원하지 않는 집계 방향입니다: {over} (가능: {', '.join(_AGGREGATE_AXES)})")
+        rows = self.year_slice(start, end)
+        block = self.values[rows]
+        mask = ~np.isnan(block)
+        if countries is not None:
+            selected = np.zeros(block.shape[1], dtype=bool)
+            selected[self.positions(countries)] = True
+            mask &= selected
+        axis = 1 if over == "countries" else 0
+        labels = self.years[rows] if over == "countries" else self.codes
+        count = mask.sum(axis=axis)
+        if how == "count":
+            return labels, count
+        if how in ("sum", "mean"):
+            total = np.add.reduce(block, axis=axis, where=mask)
+            if how == "sum":
+                result = total
+            else:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result = total / count
+        else:
+            ufunc = np.minimum if how == "min" else np.maximum
+            initial = np.inf if how == "min" else -np.inf
+            result = ufunc.reduce(block, axis=axis, where=mask, initial=initial)
+        result = np.where(count > 0, result, np.nan)
+        return labels, result
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV
+    store_dir = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_STORE
+    ingest(csv_path, store_dir)
+    store = GdpStore(store_dir)
+    print(f"{store_dir}: {store.values.shape[1]}개 국가 x {store.values.shape[0]}개 연도 ({store.values.nbytes:,} bytes)")
@@ -0,0 +1,249 @@
+import json
+import os
+from collections import defaultdict
+
+import numpy as np
+
+import artifact_cache
+
+# --- 단순화 GeoJSON 캐시 ---
+# 행정구역 경계 GeoJSON을 한 번만 읽어 여러 허용 오차(도)로 단순화한 판을 만들어 두고,
+# 지도마다 필요한 지역만 담은 FeatureCollection과 미리 계산한 경위도 범위를 돌려줍니다.
+#   - 위상 보존: 이웃 지역이 공유하는 경계는 교차점(junction)에서 잘라 호(arc) 하나로 모으고,
+#     호를 정규 방향(좌표열/역순 중 사전순으로 작은 쪽)으로 Douglas-Peucker 단순화하므로
+#     양쪽 지역이 같은 경계선을 갖게 되어 틈이나 겹침이 생기지 않습니다.
+#   - 런타임 fitbounds 대신 지역 bbox 합집합으로 lonaxis/lataxis 범위를 정합니다.
+# 결과는 원본 파일 크기/수정 시각을 키로 .cache/geo/에 저장합니다.
+
+TOLERANCES = (0.0, 0.0005, 0.002, 0.01)
+QUANTUM = 1e-7  # 이 간격 안의 좌표는 같은 꼭짓점으로 봅니다.
+COORD_DECIMALS = 5  # 출력 좌표 자릿수 (약 1m)
+ID_PROPERTY = "name"
+BOUNDS_PADDING = 0.08  # 경위도 범위 여백 (범위 폭 대비 비율)
+
+
+def _polygons(geometry):
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    return []
+
+
+def _key(point):
+    return (round(point[0] / QUANTUM), round(point[1] / QUANTUM))
+
+
+def _junctions(rings):
+    # 어떤 꼭짓점의 (앞, 뒤) 이웃 쌍이 링마다 다르면 경계가 갈라지는 교차점입니다.
+    neighbors = defaultdict(set)
+    for ring in rings:
+        n = len(ring)
+        for i, p in enumerate(ring):
+            neighbors[p].add(frozenset((ring[i - 1], ring[(i + 1) % n])))
+    return {p for p, pairs in neighbors.items() if len(pairs) > 1}
+
+
+def _canonical(arc):
+    # 같은 경계를 양쪽 지역이 반대 방향으로 지나가도 같은 키가 되도록 방향을 정합니다.
+    arc = tuple(arc)
+    if arc[0] == arc[-1]:
+        # 교차점 없는 닫힌 링: 가장 작은 꼭짓점에서 시작하도록 돌립니다.
+        body = arc[:-1]
+        start = body.index(min(body))
+        forward = body[start:] + body[:start]
+        backward = (forward[0],) + forward[:0:-1]
+        canon = min(forward, backward)
+        return canon + (canon[0],), False
+    reverse = arc[::-1]
+    return (reverse, True) if reverse < arc else (arc, False)
+
+
+def _split(ring, junctions):
+    # 닫힌 링(마지막 점 제외)을 교차점에서 잘라 호 목록으로 만듭니다.
+    cuts = [i for i, p in enumerate(ring) if p in junctions]
+    if not cuts:
+        return [list(ring) + [ring[0]]]
+    rotated = ring[cuts[0]:] + ring[:cuts[0]]
+    cuts = [c - cuts[0] for c in cuts] + [len(ring)]
+    rotated = rotated + [rotated[0]]
+    return [rotated[a:b + 1] for a, b in zip(cuts[:-1], cuts[1:])]
+
+
+def douglas_peucker(xy, tolerance):
+    n = len(xy)
+    if tolerance <= 0 or n < 3:
+        return xy
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        p, d = xy[a], xy[b] - xy[a]
+        rel = xy[a + 1:b] - p
+        length = np.hypot(*d)
+        if length == 0:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(d[0] * rel[:, 1] - d[1] * rel[:, 0]) / length
+        k = int(dist.argmax())
+        if dist[k] > tolerance:
+            keep[a + 1 + k] = True
+            stack.append((a, a + 1 + k))
+            stack.append((a + 1 + k, b))
+    return xy[keep]
+
+
+class GeoCache:
+    def __init__(self, ids, properties, bboxes, levels, vertex_counts):
+        self.ids = ids
+        self.index = {fid: i for i, fid in enumerate(ids)}
+        self.properties = properties
+        self.bboxes = bboxes  # (지역, 4) - min lon, min lat, max lon, max lat
+        self.levels = levels  # {허용 오차: [지역별 geometry]}
+        self.vertex_counts = vertex_counts
+        self._subsets = {}
+
+    @classmethod
+    def build(cls, geojson, tolerances=TOLERANCES, id_property=ID_PROPERTY):
+        features = geojson["features"]
+        ids = [str(f["properties"][id_property]) for f in features]
+        coords = {}
+        structure = []  # 지역 -> 폴리곤 -> 링(꼭짓점 키, 마지막 점 제외)
+        for feature in features:
+            polygons = []
+            for polygon in _polygons(feature["geometry"]):
+                rings = []
+                for ring in polygon:
+                    keys = [_key(p) for p in ring]
+                    for k, p in zip(keys, ring):
+                        coords.setdefault(k, (float(p[0]), float(p[1])))
+                    if keys[0] == keys[-1]:
+                        keys = keys[:-1]
+                    # 연속 중복 꼭짓점 제거
+                    keys = [k for i, k in enumerate(keys) if k != keys[i - 1]] or keys[:1]
+                    rings.append(keys)
+                polygons.append(rings)
+            structure.append(polygons)
+
+        all_rings = [ring for polygons in structure for rings in polygons for ring in rings]
+        junctions = _junctions(all_rings)
+        bboxes = np.zeros((len(structure), 4))
+        for i, polygons in enumerate(structure):
+            xy = np.array([coords[k] for rings in polygons for ring in rings for k in ring])
+            bboxes[i] = (*xy.min(axis=0), *xy.max(axis=0))
+
+        levels = {}
+        vertex_counts = {}
+        for tolerance in tolerances:
+            simplified = {}  # 정규 호 -> 단순화 좌표 (공유 경계는 한 번만 계산)
+
+            def arc_xy(arc):
+                canon, reversed_ = _canonical(arc)
+                if canon not in simplified:
+                    xy = np.array([coords[k] for k in canon])
+                    simplified[canon] = douglas_peucker(xy, tolerance)
+                xy = simplified[canon]
+                if arc[0] == arc[-1] and not reversed_:
+                    # 닫힌 링은 원래 방향을 유지합니다. (시작점만 바뀜)
+                    return xy if _ring_area(xy) * _ring_area(np.array([coords[k] for k in arc])) >= 0 else xy[::-1]
+                return xy[::-1] if reversed_ else xy
+
+            geometries = []
+            count = 0
+            for polygons, feature in zip(structure, features):
+                out = []
+                for rings in polygons:
+                    out_rings = []
+                    for i, ring in enumerate(rings):
+                        parts = [arc_xy(arc) for arc in _split(ring, junctions)]
+                        xy = np.vstack([parts[0]] + [p[1:] for p in parts[1:]])
+                        if len(np.unique(xy[:-1], axis=0)) < 3:
+                            if i == 0:
+                                break  # 바깥 링이 사라지면 폴리곤째 뺍니다.
+                            continue
+                        out_rings.append(np.round(xy, COORD_DECIMALS).tolist())
+                        count += len(xy)
+                    else:
+                        out.append(out_rings)
+                if not out:
+                    # 모든 폴리곤이 사라진 작은 지역은 원본 도형을 그대로 씁니다.
+                    geometries.append(feature["geometry"])
+                    continue
+                geometries.append({"type": "Polygon", "coordinates": out[0]} if len(out) == 1
+                                  else {"type": "MultiPolygon", "coordinates": out})
+            levels[tolerance] = geometries
+            vertex_counts[tolerance] = count
+
+        properties = [{id_property: fid} for fid in ids]
+        return cls(ids, properties, bboxes, levels, vertex_counts)
+
+    def pick_tolerance(self, width_px, ids=None):
+        # 화면에서 1픽셀이 차지하는 경도 폭을 넘지 않는 가장 큰 허용 오차를 고릅니다.
+        min_lon, _, max_lon, _ = self.bounds(ids)
+        per_pixel = (max_lon - min_lon) / max(width_px, 1)
+        usable = [t for t in self.levels if t <= per_pixel]
+        return max(usable) if usable else min(self.levels)
+
+    def _positions(self, ids):
+        if ids is None:
+            return list(range(len(self.ids)))
+        return sorted({self.index[str(fid)] for fid in ids if str(fid) in self.index})
+
+    def subset(self, ids=None, tolerance=0.0):
+        # 필요한 지역만 담은 FeatureCollection (같은 조합은 한 번만 만듭니다)
+        positions = tuple(self._positions(ids))
+        key = (positions, tolerance)
+        cached = self._subsets.get(key)
+        if cached is None:
+            geometries = self.levels[tolerance]
+            cached = {"type": "FeatureCollection", "features": [
+                {"type": "Feature", "id": self.ids[i], "properties": self.properties[i], "geometry": geometries[i]}
+                for i in positions
+            ]}
+            self._subsets[key] = cached
+        return cached
+
+    def bounds(self, ids=None):
+        boxes = self.bboxes[self._positions(ids)]
+        return boxes[:, 0].min(), boxes[:, 1].min(), boxes[:, 2].max(), boxes[:, 3].max()
+
+    def geos_layout(self, ids=None, padding=BOUNDS_PADDING):
+        # update_geos(fitbounds="locations") 대신 쓰는 고정 범위
+        min_lon, min_lat, max_lon, max_lat = self.bounds(ids)
+        pad_lon, pad_lat = (max_lon - min_lon) * padding, (max_lat - min_lat) * padding
+        return dict(
+            projection_type="mercator",
+            center=dict(lon=(min_lon + max_lon) / 2, lat=(min_lat + max_lat) / 2),
+            lonaxis_range=[min_lon - pad_lon, max_lon + pad_lon],
+            lataxis_range=[min_lat - pad_lat, max_lat + pad_lat],
+            visible=False,
+        )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_subsets"] = {}
+        return state
+
+
+def _ring_area(xy):
+    x, y = xy[:, 0], xy[:, 1]
+    return 0.5 * (np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
+
+
+def load(path, tolerances=TOLERANCES, id_property=ID_PROPERTY):
+    st = os.stat(path)
+
+    def build():
+        with open(path, "r", encoding="utf-8") as f:
+            return GeoCache.build(json.load(f), tolerances, id_property)
+
+    return artifact_cache.load_or_build(
+        "geo",
+        {"source": os.path.basename(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+         "tolerances": tolerances, "id_property": id_property},
+        build,
+        fingerprint=artifact_cache.code_fingerprint(GeoCache, douglas_peucker, _junctions, _canonical, _split),
+    )
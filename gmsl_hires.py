@@ -0,0 +1,91 @@
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+
+import artifact_cache
+
+# --- 고해상도(일/10일/월 단위) 해수면 자료 수집 ---
+# data/gmsl/ 아래의 파일을 모두 읽어 소수 연도 시간축 하나로 합칩니다. 폴더가 비어 있으면 None을 돌려주고
+# 대시보드는 연간 가상 데이터를 그대로 씁니다.
+#   - .csv: 시간 열(연도/year/time/date, 소수 연도 또는 날짜)과 값 열(해수면 높이 (mm)/gmsl/sea_level ...)
+#   - .txt/.dat: 공백 구분, '#'/'HDR' 머리줄 - NASA GSFC GMSL 파일 배치(3열 소수 연도, 9열 GIA 적용 GMSL)
+# 파싱 결과는 파일 이름/크기/수정 시각을 키로 디스크에 캐시합니다.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+HIRES_DIR = os.path.join(BASE_DIR, "data", "gmsl")
+PATTERNS = ("*.csv", "*.txt", "*.dat")
+TIME_COLUMNS = ('연도', 'year', 'time', 'date', 'decimal_year')
+VALUE_COLUMNS = ('해수면 높이 (mm)', 'gmsl', 'gmsl_mm', 'sea_level', 'value')
+TXT_COLUMNS = (2, 8)  # (소수 연도, GMSL mm) - 0부터 센 열 번호
+BASELINE_YEAR = 2020
+
+
+def source_files(directory=HIRES_DIR):
+    return sorted(p for pattern in PATTERNS for p in glob.glob(os.path.join(directory, pattern)))
+
+
+def _decimal_year(values):
+    numeric = pd.to_numeric(values, errors="coerce")
+    if numeric.notna().all():
+        return numeric.to_numpy(dtype=np.float64)
+    dates = pd.to_datetime(values)
+    start = pd.to_datetime(dates.dt.year.astype(str) + "-01-01")
+    length = np.where(dates.dt.is_leap_year, 366.0, 365.0)
+    return (dates.dt.year + (dates - start).dt.total_seconds() / 86400.0 / length).to_numpy(dtype=np.float64)
+
+
+def _pick(columns, candidates):
+    lowered = {str(c).strip().lower(): c for c in columns}
+    for name in candidates:
+        if name.lower() in lowered:
+            return lowered[name.lower()]
+    return None
+
+
+def read_file(path):
+    if path.endswith(".csv"):
+        df = pd.read_csv(path, comment="#")
+        time_col = _pick(df.columns, TIME_COLUMNS) or df.columns[0]
+        value_col = _pick(df.columns, VALUE_COLUMNS) or df.select_dtypes("number").columns[-1]
+        years, levels = _decimal_year(df[time_col]), df[value_col].to_numpy(dtype=np.float64)
+    else:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            rows = [line.split() for line in f if line.strip() and not line.lstrip().startswith(("#", "HDR"))]
+        table = np.array([[float(row[i]) for i in TXT_COLUMNS] for row in rows], dtype=np.float64)
+        years, levels = table[:, 0], table[:, 1]
+    keep = np.isfinite(years) & np.isfinite(levels)
+    return years[keep], levels[keep]
+
+
+def _combine(paths):
+    parts = [read_file(p) for p in paths]
+    years = np.concatenate([p[0] for p in parts])
+    levels = np.concatenate([p[1] for p in parts])
+    # 여러 파일이 겹치면 같은 시각은 뒤쪽 파일 값을 씁니다.
+    order = np.argsort(years, kind="stable")
+    years, levels = years[order], levels[order]
+    last = np.append(years[1:] != years[:-1], True)
+    return years[last], levels[last]
+
+
+def load(directory=HIRES_DIR):
+    paths = source_files(directory)
+    if not paths:
+        return None
+    parts = [{"file": os.path.basename(p), "size": os.stat(p).st_size, "mtime_ns": os.stat(p).st_mtime_ns} for p in paths]
+    years, levels = artifact_cache.load_or_build(
+        "gmsl_hires", parts, lambda: _combine(paths),
+        fingerprint=artifact_cache.code_fingerprint(read_file, _decimal_year, _combine),
+    )
+    # 연간 자료와 같이 기준 연도 평균을 0으로 맞춥니다. (기준 연도가 없으면 전체 평균)
+    in_base = np.floor(years) == BASELINE_YEAR
+    levels = levels - (levels[in_base].mean() if in_base.any() else levels.mean())
+    return pd.DataFrame({'연도': years, '해수면 높이 (mm)': levels})
+
+
+def annual_means(df):
+    # 연 단위 분석(추세/변화점, 미래 예측 기준점)에 쓰는 연평균 표
+    years = np.floor(df['연도']).astype(np.int64)
+    return df.groupby(years.rename('연도'))['해수면 높이 (mm)'].mean().reset_index()
@@ -0,0 +1,118 @@
+import glob
+import io
+import os
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+import artifact_cache
+
+# --- 도시 시나리오 이미지 파이프라인 ---
+# 원본 PNG(약 3MB, 1536px)를 처음 한 번만 너비별 JPEG/WebP로 줄여 .cache/images/에 저장하고,
+# 인코딩된 바이트는 용량 제한이 있는 프로세스 내 LRU 캐시에 보관합니다.
+# st.image는 PNG/JPEG/GIF가 아닌 이미지를 매번 JPEG로 다시 인코딩하므로 대시보드에는 JPEG를 보내고,
+# WebP 변형은 정적 파일/CDN 서빙용으로 함께 만들어 둡니다.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+IMAGE_DIR = os.path.join(BASE_DIR, "images")
+
+# 인코딩 설정이 바뀌면 올려 주세요. (디스크 캐시 키에 포함됩니다)
+PIPELINE_VERSION = 1
+WIDTHS = (480, 960, 1440)
+FORMATS = {"jpeg": ("JPEG", ".jpg", {"quality": 82, "optimize": True, "progressive": True}),
+           "webp": ("WEBP", ".webp", {"quality": 80, "method": 4})}
+# Streamlit이 "wide" 레이아웃에서 본문에 그리는 최대 폭(px)입니다.
+WIDE_CONTENT_WIDTH = 1460
+MAX_CACHE_BYTES = int(os.environ.get("DASHBOARD_IMAGE_CACHE_BYTES", 32 * 1024 * 1024))
+
+
+def pick_width(layout_fraction=1.0, content_width=WIDE_CONTENT_WIDTH):
+    # 이미지가 차지하는 화면 폭보다 크거나 같은 가장 작은 변형을 고릅니다.
+    target = layout_fraction * content_width
+    for width in WIDTHS:
+        if width >= target:
+            return width
+    return WIDTHS[-1]
+
+
+def _variant_path(source_path, width, fmt):
+    st = os.stat(source_path)
+    parts = {"source": os.path.basename(source_path), "size": st.st_size,
+             "mtime_ns": st.st_mtime_ns, "width": width, "format": fmt}
+    return artifact_cache.artifact_path("images", parts, f"v{PIPELINE_VERSION}", suffix=FORMATS[fmt][1])
+
+
+def _encode(image, width, fmt):
+    pil_format, _, options = FORMATS[fmt]
+    if image.width > width:
+        height = round(image.height * width / image.width)
+        image = image.resize((width, height), resample=Image.LANCZOS)
+    buf = io.BytesIO()
+    image.convert("RGB").save(buf, format=pil_format, **options)
+    return buf.getvalue()
+
+
+def build_variants(source_path, widths=WIDTHS, formats=tuple(FORMATS)):
+    # 빠진 변형만 만들고, 원본은 한 번만 디코딩합니다.
+    missing = [(w, f) for w in widths for f in formats if not os.path.exists(_variant_path(source_path, w, f))]
+    if not missing:
+        return 0
+    with Image.open(source_path) as image:
+        image.load()
+        for width, fmt in missing:
+            artifact_cache.write_atomic(_variant_path(source_path, width, fmt), _encode(image, width, fmt))
+    return len(missing)
+
+
+class ImageCache:
+    def __init__(self, max_bytes=MAX_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source_path, width, fmt="jpeg"):
+        key = (source_path, width, fmt)
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+        path = _variant_path(source_path, width, fmt)
+        if not os.path.exists(path):
+            build_variants(source_path, widths=(width,), formats=(fmt,))
+        with open(path, "rb") as f:
+            data = f.read()
+        with self._lock:
+            self.misses += 1
+            if key not in self._entries:
+                self._entries[key] = data
+                self.bytes += len(data)
+                while self.bytes > self.max_bytes and len(self._entries) > 1:
+                    _, old = self._entries.popitem(last=False)
+                    self.bytes -= len(old)
+        return data
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.bytes, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses}
+
+
+_cache = ImageCache()
+get_image = _cache.get
+stats = _cache.stats
+
+
+def source_images():
+    return sorted(glob.glob(os.path.join(IMAGE_DIR, "*.png")))
+
+
+if __name__ == "__main__":
+    for path in source_images():
+        built = build_variants(path)
+        print(f"{os.path.basename(path)}: {built}개 변형 생성")
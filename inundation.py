@@ -0,0 +1,111 @@
+import functools
+import io
+import os
+import zlib
+
+import numpy as np
+from PIL import Image
+
+import artifact_cache
+import image_pipeline
+
+# --- 해수면 상승 침수 렌더러 ---
+# 도시별 고도 래스터(m)를 상승 높이로 임계 처리해 침수 영역을 구하고 기본 이미지 위에 겹쳐 그립니다.
+# 슬라이더의 모든 단계(0.5~2.0m, 0.1m 간격)에 대한 마스크를 "처음 잠기는 단계 번호" 래스터 하나(uint8)로
+# 미리 계산해 두므로, 슬라이더를 움직일 때는 비교 한 번과 합성/인코딩만 하면 됩니다.
+# data/elevation/<도시>.npy 파일이 있으면 그것을 쓰고, 없으면 도시 이름으로 시드를 정한 가상 래스터를 만듭니다.
+# 방재 시설 높이(protection_m, exposure.CITY_PROFILES)를 넘겨받으면 노출 모델처럼 수위를 그만큼 낮춰 그립니다.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ELEVATION_DIR = os.path.join(BASE_DIR, "data", "elevation")
+
+RISE_LEVELS = np.round(np.arange(0.5, 2.0 + 1e-9, 0.1), 1)
+RASTER_SHAPE = (240, 360)  # (행, 열) - 이미지보다 거칠게 계산하고 합성할 때 확대합니다.
+WATER_RGB = (30, 90, 200)
+WATER_ALPHA = 130
+RENDER_WIDTH = 1440
+
+
+def city_key(image_path):
+    return os.path.splitext(os.path.basename(image_path))[0]
+
+
+def synthetic_elevation(key, shape=RASTER_SHAPE):
+    # 시나리오 그림은 바다를 앞에 둔 원근 그림이므로 래스터 아래쪽 가장자리를 해안선으로 두고,
+    # 위로 갈수록 높아지게 합니다. 도시마다 해안선 기울기, 저지대 분지, 완만한 기복이 다릅니다.
+    rng = np.random.default_rng(zlib.crc32(key.encode("utf-8")))
+    rows, cols = shape
+    y, x = np.mgrid[0:1:rows * 1j, 0:1:cols * 1j]
+    tilt = rng.uniform(-0.08, 0.08)
+    coast_distance = np.clip(1.0 - y + tilt * (x - 0.5), 0, None)
+    elevation = 0.2 + 9.0 * coast_distance ** 1.4
+    for _ in range(3):
+        cy, cx = rng.uniform(0.55, 0.9), rng.uniform(0.1, 0.9)
+        radius = rng.uniform(0.04, 0.12)
+        depth = rng.uniform(0.8, 2.0)
+        elevation -= depth * np.exp(-((x - cx) ** 2 + ((y - cy) * 1.5) ** 2) / (2 * radius ** 2))
+    fx, phase = rng.uniform(2, 6), rng.uniform(0, 2 * np.pi)
+    elevation += 0.25 * np.sin(2 * np.pi * fx * x + phase)
+    return np.clip(elevation, -1.0, None).astype(np.float32)
+
+
+def elevation_raster(key):
+    path = os.path.join(ELEVATION_DIR, f"{key}.npy")
+    if os.path.exists(path):
+        return np.load(path, mmap_mode="r")
+    return artifact_cache.load_or_build(
+        "elevation",
+        {"city": key, "shape": RASTER_SHAPE},
+        lambda: synthetic_elevation(key),
+        fingerprint=artifact_cache.code_fingerprint(synthetic_elevation),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def flood_index(key, protection_m=0.0):
+    # 각 픽셀이 처음 잠기는 RISE_LEVELS의 번호 (끝까지 안 잠기면 len(RISE_LEVELS))
+    # 단계 i의 침수 마스크는 flood_index(key) <= i 입니다. 방재 시설이 있으면 수위가 max(상승 높이 - protection_m, 0)이므로
+    # 해수면보다 높은 픽셀은 고도 + protection_m을 넘어야 잠기고, 해수면 아래 픽셀은 모든 단계에서 잠깁니다.
+    # 고도는 float32이지만 RISE_LEVELS(float64)와 같은 정밀도로 더하고 비교해서, 딱 맞는 단계가 반올림으로 한 칸 밀리지 않게 합니다.
+    elevation = np.asarray(elevation_raster(key), dtype=np.float64)
+    threshold = np.where(elevation > 0, elevation + float(protection_m), elevation)
+    return np.searchsorted(RISE_LEVELS, threshold, side="left").astype(np.uint8)
+
+
+def level_index(rise_level_m):
+    # 슬라이더 값(0.1 간격 float)을 float64로 비교해 가장 가까운 단계를 고릅니다.
+    return int(np.abs(RISE_LEVELS - np.float64(rise_level_m)).argmin())
+
+
+def flooded_fraction(key, protection_m=0.0):
+    # 모든 단계의 침수 면적 비율을 한 번에 계산합니다.
+    index = flood_index(key, protection_m)
+    counts = np.bincount(index.ravel(), minlength=len(RISE_LEVELS) + 1)
+    return np.cumsum(counts)[:len(RISE_LEVELS)] / index.size
+
+
+@functools.lru_cache(maxsize=16)
+def _base_image(image_path, width):
+    with Image.open(io.BytesIO(image_pipeline.get_image(image_path, width))) as image:
+        return image.convert("RGB")
+
+
+@functools.lru_cache(maxsize=96)
+def _render(image_path, index, width, protection_m):
+    base = _base_image(image_path, width)
+    alpha = np.where(flood_index(city_key(image_path), protection_m) <= index, WATER_ALPHA, 0).astype(np.uint8)
+    mask = Image.fromarray(alpha, mode="L").resize(base.size, resample=Image.BILINEAR)
+    water = Image.new("RGB", base.size, WATER_RGB)
+    composite = Image.composite(water, base, mask)
+    buf = io.BytesIO()
+    composite.save(buf, format="JPEG", quality=82)
+    return buf.getvalue()
+
+
+def render(image_path, rise_level_m, width=RENDER_WIDTH, protection_m=0.0):
+    return _render(image_path, level_index(rise_level_m), width, float(protection_m))
+
+
+def prerender(image_path, width=RENDER_WIDTH, protection_m=0.0):
+    for index in range(len(RISE_LEVELS)):
+        _render(image_path, index, width, float(protection_m))
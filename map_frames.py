@@ -0,0 +1,71 @@
+import numpy as np
+
+import startup
+
+go = startup.lazy_import("plotly.graph_objects")
+
+# --- 연도 애니메이션 지도 ---
+# 모든 연도를 Plotly frame으로 한 그림에 담아 연도 이동/재생을 브라우저에서만 처리합니다.
+# 위치, GeoJSON, 색 범위, 호버 형식 같은 공통 속성은 기본 trace에 한 번만 두고,
+# 각 frame에는 기본 trace와 달라지는 값(z 배열, 제목)만 싣습니다. z는 float32로 보내
+# Plotly가 base64 typed array로 직렬화하므로 frame당 지역 수 x 4바이트 정도입니다.
+# 그림은 figure_cache에 데이터셋 버전별로 한 번만 만들어 둡니다.
+
+FRAME_DURATION_MS = 400
+VALUE_DECIMALS = 2
+
+
+def _play_buttons():
+    play = dict(label="▶ 재생", method="animate",
+                args=[None, {"frame": {"duration": FRAME_DURATION_MS, "redraw": True}, "fromcurrent": True,
+                             "transition": {"duration": 0}}])
+    pause = dict(label="⏸ 정지", method="animate",
+                 args=[[None], {"frame": {"duration": 0, "redraw": False}, "mode": "immediate",
+                                "transition": {"duration": 0}}])
+    return [dict(type="buttons", direction="left", x=0.0, y=0.0, xanchor="left", yanchor="top",
+                 pad={"t": 10, "r": 10}, showactive=False, buttons=[play, pause])]
+
+
+def _slider(times, prefix):
+    steps = [dict(label=str(t), method="animate",
+                  args=[[str(t)], {"frame": {"duration": 0, "redraw": True}, "mode": "immediate",
+                                   "transition": {"duration": 0}}])
+             for t in times]
+    return [dict(active=len(times) - 1, steps=steps, x=0.12, len=0.88, y=0.0, yanchor="top",
+                 pad={"t": 10}, currentvalue={"prefix": prefix})]
+
+
+def value_matrix(df, time_col, location_col, value_col):
+    # (시점, 지역) 값 행렬 - 자료가 없는 칸은 NaN (지도에서 비워 둡니다)
+    wide = df.pivot_table(index=time_col, columns=location_col, values=value_col, aggfunc="first", observed=True)
+    wide = wide.sort_index()
+    values = np.round(wide.to_numpy(dtype=np.float64), VALUE_DECIMALS).astype(np.float32)
+    return wide.index.to_list(), [str(c) for c in wide.columns], values
+
+
+def animated_choropleth(df, time_col, location_col, value_col, title, *, colorscale, range_color,
+                        value_label, geojson=None, featureidkey=None, locationmode=None,
+                        geos=None, height=None, slider_prefix="연도: "):
+    times, locations, values = value_matrix(df, time_col, location_col, value_col)
+    start = len(times) - 1
+    trace = dict(locations=locations, z=values[start], zmin=range_color[0], zmax=range_color[1],
+                 colorscale=colorscale, colorbar=dict(title=value_label), text=locations,
+                 hovertemplate=f"<b>%{{text}}</b><br>{value_label}: %{{z:,.{VALUE_DECIMALS}f}}<extra></extra>")
+    if geojson is not None:
+        trace.update(geojson=geojson, featureidkey=featureidkey)
+    if locationmode is not None:
+        trace.update(locationmode=locationmode)
+
+    fig = go.Figure(go.Choropleth(**trace))
+    fig.frames = [
+        go.Frame(name=str(t), data=[go.Choropleth(z=values[i])], traces=[0],
+                 layout=dict(title_text=title.format(t)))
+        for i, t in enumerate(times)
+    ]
+    fig.update_layout(title_text=title.format(times[start]), updatemenus=_play_buttons(),
+                      sliders=_slider(times, slider_prefix), margin={"r": 0, "t": 40, "l": 0, "b": 0})
+    if height is not None:
+        fig.update_layout(height=height)
+    if geos is not None:
+        fig.update_geos(**geos)
+    return fig
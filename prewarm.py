@@ -0,0 +1,66 @@
+import os
+import time
+
+import artifact_cache
+import crisis_cube
+import datasets
+import exposure
+import figure_cache
+import image_pipeline
+import trend_analysis
+import year_index
+
+# --- 캐시 미리 데우기 ---
+# warm(): 모든 데이터셋과 그 색인(연도 색인, 추세 분석, 위기 연쇄 큐브), 노출 표를 디스크 아티팩트에서 메모리로 올립니다.
+#   DASHBOARD_PREWARM=1이면 앱이 첫 화면을 다 그린 뒤 백그라운드 스레드에서 한 번 부릅니다. (startup.prewarm_in_background)
+# python prewarm.py: 배포 직후나 이미지를 만들 때 한 번 실행합니다. 데이터/지도/이미지 아티팩트를 만들고,
+#   탭마다 기본 화면을 AppTest로 그려 그 그림들을 .cache/figures/에 저장합니다. 새 프로세스는 저장된 그림을 읽으므로
+#   기본 화면을 그릴 때 Plotly Express를 불러오거나 그림을 만들지 않습니다.
+# 실행: python prewarm.py
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+YEAR_INDEX_DATASETS = ('gmsl', 'factors')
+TREND_DATASETS = ('gmsl', 'regional_fishery', 'fish_production', 'aquaculture')
+
+
+def warm():
+    for name in datasets.names():
+        try:
+            datasets.get(name)
+        except FileNotFoundError:
+            pass  # 대한민국 지도 파일이 없으면 탭 2가 안내 문구를 보여 줍니다.
+    gmsl_source = 'gmsl_hires' if datasets.get('gmsl_hires') is not None else 'gmsl'
+    for name in (gmsl_source,) + YEAR_INDEX_DATASETS:
+        year_index.for_dataset(name)
+    for name in TREND_DATASETS:
+        trend_analysis.indexes(name)
+    crisis_cube.cube()
+    exposure.exposure_table()
+
+
+def persist_default_figures():
+    # 탭마다 기본 위젯 값으로 앱을 한 번씩 실행하고, 그때 만든 그림을 디스크에 저장합니다.
+    from streamlit.testing.v1 import AppTest
+
+    figure_cache._cache.persist = True
+    at = AppTest.from_file(os.path.join(BASE_DIR, "streamlit_app.py"), default_timeout=600)
+    at.run()
+    tabs = [tab.label for tab in at.tabs]
+    for tab in tabs:
+        at.session_state['main_tab'] = tab
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"{tab}: {at.exception[0].message}")
+    artifact_cache.evict_stale("figures", figure_cache.code_fingerprint())
+    return len(tabs)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    warm()
+    print(f"데이터셋/색인: {time.perf_counter() - start:.1f}s")
+    built = sum(image_pipeline.build_variants(path) for path in image_pipeline.source_images())
+    print(f"이미지 변형 {built}개 생성")
+    start = time.perf_counter()
+    tabs = persist_default_figures()
+    print(f"탭 {tabs}개의 기본 그림 저장: {figure_cache.stats()['entries']}개, {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,136 @@
+import atexit
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+import artifact_cache
+
+# --- 2100년 해수면 상승 앙상블 예측 ---
+# 시나리오 곡선 rise(t) = a * t^p + b * t 의 계수를 구성원마다 흔들고 연도별 AR(1) 변동을 더해
+# N개의 궤적을 만든 뒤, 5/50/95 백분위 띠만 돌려줍니다.
+# 구성원은 CHUNK_SIZE개씩 나눠 SeedSequence로 독립 시드를 주므로 직렬/프로세스 풀 실행 결과가 같습니다.
+# 결과는 (시나리오, N, seed)별로 디스크와 메모리에 캐시합니다.
+# 프로세스 풀은 처음 필요할 때 하나만 띄워 두고 다시 쓰며, 프로세스가 끝날 때 atexit으로 닫습니다.
+
+START_YEAR = 2024
+END_YEAR = 2100
+PERCENTILES = (5, 50, 95)
+CHUNK_SIZE = 10_000
+POOL_THRESHOLD = 50_000  # 이 이상이면 프로세스 풀에서 나눠 계산합니다.
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+SCENARIOS = {
+    "high": {"label": "현재 추세 유지 (고탄소)", "color": "#D32F2F", "band_color": "rgba(211, 47, 47, 0.2)", "a": 0.001, "p": 2.2, "b": 4.5},
+    "low": {"label": "적극적 감축 (저탄소)", "color": "#1976D2", "band_color": "rgba(25, 118, 210, 0.2)", "a": 0.0005, "p": 2.0, "b": 2.8},
+}
+# 계수 불확실성: a는 로그정규 배율, p는 가산 정규, b는 정규 배율 / 연도별 변동은 AR(1) (mm)
+A_LOG_SD = 0.25
+P_SD = 0.04
+B_REL_SD = 0.10
+NOISE_SD = 3.0
+NOISE_PHI = 0.7
+
+
+def future_years():
+    return np.arange(START_YEAR + 1, END_YEAR + 1)
+
+
+def simulate(scenario, n_members, seed_seq):
+    params = SCENARIOS[scenario]
+    rng = np.random.default_rng(seed_seq)
+    t = (future_years() - START_YEAR).astype(np.float64)
+    a = params["a"] * rng.lognormal(0.0, A_LOG_SD, n_members)
+    p = params["p"] + rng.normal(0.0, P_SD, n_members)
+    b = params["b"] * rng.normal(1.0, B_REL_SD, n_members)
+    trend = a[:, np.newaxis] * t[np.newaxis, :] ** p[:, np.newaxis] + b[:, np.newaxis] * t[np.newaxis, :]
+
+    shocks = rng.normal(0.0, NOISE_SD * np.sqrt(1 - NOISE_PHI ** 2), (n_members, len(t)))
+    noise = np.empty_like(shocks)
+    noise[:, 0] = shocks[:, 0]
+    for i in range(1, len(t)):
+        noise[:, i] = NOISE_PHI * noise[:, i - 1] + shocks[:, i]
+    return (trend + noise).astype(np.float32)
+
+
+def _chunks(n_members, seed):
+    sizes = [min(CHUNK_SIZE, n_members - lo) for lo in range(0, n_members, CHUNK_SIZE)]
+    return list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _shared_pool():
+    # 프로세스당 하나인 작업 프로세스 풀 (처음 부를 때 만듭니다)
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Streamlit 서버는 다중 스레드이므로 fork 대신 spawn으로 작업 프로세스를 띄웁니다.
+            _pool = ProcessPoolExecutor(MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _discard_pool(pool):
+    # 작업 프로세스가 죽어 못 쓰게 된 풀을 버립니다. (다음 호출이 새로 만듭니다)
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@atexit.register
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def run_ensemble(scenario, n_members, seed):
+    chunks = _chunks(n_members, seed)
+    if n_members >= POOL_THRESHOLD and MAX_WORKERS > 1:
+        pool = _shared_pool()
+        try:
+            parts = list(pool.map(simulate, [scenario] * len(chunks), *zip(*chunks)))
+        except BrokenProcessPool:
+            _discard_pool(pool)
+            parts = [simulate(scenario, size, seed_seq) for size, seed_seq in chunks]
+    else:
+        parts = [simulate(scenario, size, seed_seq) for size, seed_seq in chunks]
+    return np.concatenate(parts)
+
+
+def _bands(scenario, n_members, seed):
+    trajectories = run_ensemble(scenario, n_members, seed)
+    return np.percentile(trajectories, PERCENTILES, axis=0)
+
+
+@functools.lru_cache(maxsize=32)
+def bands(scenario, n_members, seed):
+    # (백분위 수, 연도 수) 배열 - 2024년 대비 상승량 (mm)
+    return artifact_cache.load_or_build(
+        "projection",
+        {"scenario": scenario, "n": n_members, "seed": seed, "percentiles": PERCENTILES,
+         "params": {k: SCENARIOS[scenario][k] for k in ("a", "p", "b")}, "uncertainty": (A_LOG_SD, P_SD, B_REL_SD, NOISE_SD, NOISE_PHI)},
+        lambda: _bands(scenario, n_members, seed),
+        fingerprint=artifact_cache.code_fingerprint(simulate, _chunks, _bands),
+    )
+
+
+def band_frame(n_members, seed, offset=0.0):
+    # fig5용 표: 연도, 시나리오, p5/p50/p95
+    years = future_years()
+    frames = []
+    for scenario, params in SCENARIOS.items():
+        low, mid, high = bands(scenario, n_members, seed) + offset
+        frames.append(pd.DataFrame({'연도': years, '시나리오': params["label"], 'p5': low, 'p50': mid, 'p95': high}))
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,224 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# --- 구간 계측 (span) ---
+# 데이터 준비/그림 생성 같은 구간을 `with spans.span("figure:gmsl_line", "figure") as s:`로 감싸면
+# 벽시계 시간, 구간 동안 늘어난/최대 메모리 할당(tracemalloc), 브라우저로 보내는 크기(s.set(payload=...))를 기록합니다.
+# 기록은 사이드바 디버그 패널에서 켠 세션에서만 하며, 아무 세션도 켜지 않았으면 span()은 공용 no-op 객체를 돌려주므로
+# 비용은 dict 검사 한 번입니다. tracemalloc은 켠 세션이 하나라도 있을 때만 돌립니다. (프로세스 전체 할당을 세므로
+# 여러 세션이 동시에 실행 중이면 할당 값에 다른 세션 몫이 섞일 수 있습니다)
+# 기록을 켠 채로 브라우저를 닫은 세션의 Trace는 다른 세션이 enable()을 부를 때 지웁니다. (런타임에 더 이상 활성 세션이
+# 아니거나 IDLE_SECONDS 동안 구간을 기록하지 않은 세션 - fragment만 다시 실행되는 세션도 span()에서 시각을 갱신합니다)
+# 남은 Trace가 없으면 tracemalloc도 멈춥니다.
+# 기록은 Chrome trace 형식(chrome://tracing, Perfetto)으로 내보낼 수 있습니다.
+
+MAX_SPANS = int(os.environ.get("DASHBOARD_SPANS_MAX", 2000))
+# DASHBOARD_SPANS=panel이면 사이드바 디버그 패널만 보이고(기록은 세션마다 켬), 1이면 패널을 보이고 기록도 기본으로 켭니다.
+# 설정하지 않으면 패널을 숨기고 어떤 세션도 기록하지 않습니다.
+DEBUG_PANEL = os.environ.get("DASHBOARD_SPANS") in ("1", "panel")
+DEFAULT_ENABLED = os.environ.get("DASHBOARD_SPANS") == "1"
+IDLE_SECONDS = float(os.environ.get("DASHBOARD_SPANS_IDLE", 30 * 60))
+
+_traces = {}  # 세션 id -> Trace
+_lock = threading.Lock()
+_started_tracemalloc = False
+_origin_ns = time.perf_counter_ns()
+
+
+class Trace:
+    def __init__(self, max_spans=MAX_SPANS):
+        self.spans = deque(maxlen=max_spans)
+        self.stack = []
+        self.last_seen = time.monotonic()
+
+
+class Span:
+    __slots__ = ("trace", "name", "cat", "args", "payload", "start_ns", "dur_ns", "depth",
+                 "tid", "mem_start", "alloc", "peak", "max_abs")
+
+    def __init__(self, trace, name, cat):
+        self.trace = trace
+        self.name = name
+        self.cat = cat
+        self.args = {}
+        self.payload = None
+        self.alloc = None
+        self.peak = None
+
+    def set(self, payload=None, **args):
+        if payload is not None:
+            self.payload = (self.payload or 0) + int(payload)
+        self.args.update(args)
+        return self
+
+    def __enter__(self):
+        stack = self.trace.stack
+        self.depth = len(stack)
+        self.tid = threading.get_ident()
+        self.mem_start = None
+        if tracemalloc.is_tracing():
+            self.mem_start = tracemalloc.get_traced_memory()[0]
+            self.max_abs = self.mem_start
+            tracemalloc.reset_peak()
+        stack.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.dur_ns = time.perf_counter_ns() - self.start_ns
+        stack = self.trace.stack
+        if stack and stack[-1] is self:
+            stack.pop()
+        if self.mem_start is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            # 안쪽 span이 reset_peak()를 부르므로 최대값은 안쪽 span이 본 최대값과 합칩니다.
+            peak = max(peak, self.max_abs)
+            self.alloc = current - self.mem_start
+            self.peak = peak - self.mem_start
+            if stack and stack[-1].mem_start is not None:
+                stack[-1].max_abs = max(stack[-1].max_abs, peak)
+        self.trace.spans.append(self)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, payload=None, **args):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def _session_id():
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else None
+
+
+def current():
+    # 지금 세션의 Trace (기록을 켜지 않았으면 None)
+    if not _traces:
+        return None
+    trace = _traces.get(_session_id())
+    if trace is not None:
+        trace.last_seen = time.monotonic()
+    return trace
+
+
+def span(name, cat="prep"):
+    if not _traces:
+        return _NOOP
+    trace = _traces.get(_session_id())
+    if trace is None:
+        return _NOOP
+    trace.last_seen = time.monotonic()
+    return Span(trace, name, cat)
+
+
+def _ended(session_id, trace, now):
+    if now - trace.last_seen > IDLE_SECONDS:
+        return True
+    return runtime.exists() and not runtime.get_instance().is_active_session(session_id)
+
+
+def enable(on, memory=True):
+    # 현재 세션의 기록을 켜거나 끕니다. 스크립트 맨 위에서 매 재실행마다 부릅니다.
+    global _started_tracemalloc
+    session_id = _session_id()
+    now = time.monotonic()
+    with _lock:
+        for other, trace in list(_traces.items()):
+            if other != session_id and _ended(other, trace, now):
+                del _traces[other]
+        if on:
+            trace = _traces.get(session_id)
+            if trace is None:
+                trace = _traces[session_id] = Trace()
+            trace.last_seen = now
+        else:
+            _traces.pop(session_id, None)
+        if _traces and memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracemalloc = True
+        elif not _traces and _started_tracemalloc:
+            tracemalloc.stop()
+            _started_tracemalloc = False
+    return current()
+
+
+def clear():
+    trace = current()
+    if trace is not None:
+        trace.spans.clear()
+
+
+def records(trace=None):
+    trace = trace or current()
+    if trace is None:
+        return []
+    return [{
+        "구간": "  " * s.depth + s.name,
+        "종류": s.cat,
+        "시작 (ms)": round((s.start_ns - _origin_ns) / 1e6, 1),
+        "시간 (ms)": round(s.dur_ns / 1e6, 2),
+        "할당 (KB)": None if s.alloc is None else round(s.alloc / 1024, 1),
+        "최대 할당 (KB)": None if s.peak is None else round(s.peak / 1024, 1),
+        "전송 크기 (KB)": None if s.payload is None else round(s.payload / 1024, 1),
+        **s.args,
+    } for s in sorted(trace.spans, key=lambda s: s.start_ns)]
+
+
+def summary(trace=None):
+    # 구간 이름별 횟수/합계/평균/최대 시간과 전송 크기
+    trace = trace or current()
+    if trace is None:
+        return []
+    totals = {}
+    for s in trace.spans:
+        row = totals.setdefault(s.name, {"구간": s.name, "종류": s.cat, "횟수": 0, "합계 (ms)": 0.0,
+                                         "최대 (ms)": 0.0, "최대 할당 (KB)": None, "전송 크기 (KB)": None})
+        ms = s.dur_ns / 1e6
+        row["횟수"] += 1
+        row["합계 (ms)"] += ms
+        row["최대 (ms)"] = max(row["최대 (ms)"], ms)
+        if s.peak is not None:
+            row["최대 할당 (KB)"] = max(row["최대 할당 (KB)"] or 0.0, s.peak / 1024)
+        if s.payload is not None:
+            row["전송 크기 (KB)"] = s.payload / 1024
+    rows = sorted(totals.values(), key=lambda r: r["합계 (ms)"], reverse=True)
+    for row in rows:
+        row["평균 (ms)"] = row["합계 (ms)"] / row["횟수"]
+        for key, value in row.items():
+            if isinstance(value, float):
+                row[key] = round(value, 2)
+    return rows
+
+
+def chrome_trace(trace=None):
+    # Chrome trace event 형식 JSON (chrome://tracing 또는 https://ui.perfetto.dev 에서 열기)
+    trace = trace or current()
+    events = []
+    for s in (trace.spans if trace is not None else ()):
+        args = dict(s.args)
+        if s.alloc is not None:
+            args.update(alloc_bytes=s.alloc, peak_alloc_bytes=s.peak)
+        if s.payload is not None:
+            args["payload_bytes"] = s.payload
+        events.append({"name": s.name, "cat": s.cat, "ph": "X", "pid": os.getpid(), "tid": s.tid,
+                       "ts": (s.start_ns - _origin_ns) / 1000, "dur": s.dur_ns / 1000, "args": args})
+    events.sort(key=lambda e: e["ts"])
+    return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, ensure_ascii=False, default=str)
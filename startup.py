@@ -0,0 +1,58 @@
+import importlib
+import os
+import threading
+import time
+
+# --- 시작 경로 ---
+# 새 프로세스의 첫 화면을 빨리 그리기 위한 도구입니다.
+#   - lazy_import: 속성을 처음 쓸 때 모듈을 불러오는 대리 객체 (Plotly Express처럼 그림을 새로 만들 때만 필요한 모듈)
+#   - mark: 프로세스에서 각 단계(탭 틀, 모듈, 첫 화면 완료)에 처음 도달한 시각 - benchmarks/bench_startup.py가 읽습니다.
+#   - prewarm_in_background: 첫 화면을 다 그린 뒤 나머지 탭의 데이터를 디스크 아티팩트에서 미리 올려 둡니다.
+#     (프로세스당 한 번, DASHBOARD_PREWARM=1일 때만) 모든 데이터셋과 색인을 메모리에 올리므로 기본은 꺼 두고,
+#     메모리는 사용자가 연 탭만큼만 씁니다. 메모리보다 다른 탭의 첫 열기 속도가 중요한 배포에서 켭니다.
+
+PREWARM = os.environ.get("DASHBOARD_PREWARM", "0") == "1"
+
+_marks = {}
+_prewarm_started = False
+_lock = threading.Lock()
+
+
+class LazyModule:
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            # import 잠금 덕분에 여러 세션이 동시에 처음 써도 한 번만 불러옵니다.
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}{' (loaded)' if self._module is not None else ''}>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
+
+
+def mark(phase):
+    _marks.setdefault(phase, time.perf_counter())
+
+
+def marks():
+    return dict(_marks)
+
+
+def prewarm_in_background():
+    global _prewarm_started
+    with _lock:
+        if _prewarm_started or not PREWARM:
+            return None
+        _prewarm_started = True
+    import prewarm
+    thread = threading.Thread(target=prewarm.warm, name="dashboard-prewarm", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,162 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+import datasets
+import spans
+
+# --- 추세/변화점 분석 ---
+# 연도별 시계열 하나에 대해 x, y, x^2 ... 의 누적합을 만들어 두고, 슬라이더로 고를 수 있는
+# 모든 연도 구간 [i, j)의 결과를 (n+1, n+1) 행렬로 한 번에 계산합니다. 이후 슬라이더 이동은 행렬 조회입니다.
+#   - 선형 OLS: 기울기(연평균 변화량), 절편, 기울기 표준오차
+#   - 2차 OLS: 가속도(2 x 2차항 계수, 단위/년^2)
+#   - 변화점: 구간을 두 선형 구간으로 나눴을 때 잔차제곱합이 가장 작아지는 연도와 전후 기울기
+# LOWESS 평활선은 statsmodels로 전체 시계열에 한 번만 계산합니다.
+
+MIN_SEGMENT = 4  # 변화점 양쪽 구간의 최소 점 개수
+LOWESS_FRAC = 0.3
+
+
+def ols(n, sx, sxx, sy, sxy, syy):
+    # 합 (n, Σx, Σx², Σy, Σxy, Σy²) -> 선형 OLS (기울기, 잔차제곱합, 기울기 표준오차)
+    # 스칼라와 구간 행렬 모두 받습니다. (year_index.YearSeries도 같은 식을 씁니다)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sxx_c = sxx - sx ** 2 / n
+        sxy_c = sxy - sx * sy / n
+        syy_c = syy - sy ** 2 / n
+        slope = np.where(n >= 2, sxy_c / sxx_c, np.nan)
+        sse = np.where(n >= 2, np.clip(syy_c - slope * sxy_c, 0, None), np.nan)
+        slope_se = np.where(n >= 3, np.sqrt(sse / (n - 2) / sxx_c), np.nan)
+    return slope, sse, slope_se
+
+
+def _pair_sums(prefix):
+    # prefix: (n+1, ...) 누적합 -> [i, j] 구간 합 (n+1, n+1, ...)
+    return prefix[np.newaxis, :] - prefix[:, np.newaxis]
+
+
+class TrendIndex:
+    def __init__(self, years, values, min_segment=MIN_SEGMENT):
+        order = np.argsort(years)
+        self.years = np.asarray(years, dtype=np.float64)[order]
+        self.values = np.asarray(values, dtype=np.float64)[order]
+        self.min_segment = min_segment
+        self._lowess = None
+
+        # 연도를 가운데로 옮겨 거듭제곱 합의 자릿수를 줄입니다.
+        self.center = self.years.mean()
+        x = self.years - self.center
+        y = self.values
+        terms = np.stack([np.ones_like(x), x, x ** 2, x ** 3, x ** 4, y, x * y, x ** 2 * y, y ** 2], axis=1)
+        prefix = np.vstack([np.zeros(terms.shape[1]), np.cumsum(terms, axis=0)])
+        sums = _pair_sums(prefix)
+        n, sx, sxx, sx3, sx4, sy, sxy, sx2y, syy = np.moveaxis(sums, -1, 0)
+
+        self.slope, self.sse, self.slope_se = ols(n, sx, sxx, sy, sxy, syy)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.intercept = (sy - self.slope * sx) / n  # 가운데로 옮긴 x 기준
+
+        # 2차 적합은 3x3 정규방정식을 모든 구간에 대해 한 번에 풉니다.
+        self.accel = np.full(n.shape, np.nan)
+        ok = n >= 3
+        if ok.any():
+            lhs = np.stack([np.stack([n, sx, sxx], -1), np.stack([sx, sxx, sx3], -1), np.stack([sxx, sx3, sx4], -1)], -2)[ok]
+            rhs = np.stack([sy, sxy, sx2y], -1)[ok]
+            coef = np.linalg.solve(lhs, rhs[..., np.newaxis])[..., 0]
+            self.accel[ok] = 2 * coef[:, 2]
+
+        # 변화점: cost[i, k, j] = SSE[i, k] + SSE[k, j], 양쪽 구간이 min_segment 이상일 때만 유효
+        seg_sse = np.where(n >= min_segment, self.sse, np.inf)
+        cost = seg_sse[:, :, np.newaxis] + seg_sse[np.newaxis, :, :]
+        best = np.argmin(cost, axis=1)
+        best_cost = np.take_along_axis(cost, best[:, np.newaxis, :], axis=1)[:, 0, :]
+        self.changepoint = np.where(np.isfinite(best_cost), best, -1)
+
+    def _range(self, start_year=None, end_year=None):
+        i = 0 if start_year is None else int(np.searchsorted(self.years, start_year, side="left"))
+        j = len(self.years) if end_year is None else int(np.searchsorted(self.years, end_year, side="right"))
+        return i, j
+
+    def query(self, start_year=None, end_year=None):
+        i, j = self._range(start_year, end_year)
+        result = {
+            "n": j - i,
+            "slope": float(self.slope[i, j]),
+            "slope_se": float(self.slope_se[i, j]),
+            "intercept": float(self.intercept[i, j] - self.slope[i, j] * self.center),
+            "accel": float(self.accel[i, j]),
+            "changepoint_year": None,
+            "slope_before": np.nan,
+            "slope_after": np.nan,
+        }
+        k = int(self.changepoint[i, j])
+        if k >= 0:
+            result["changepoint_year"] = int(self.years[k])
+            result["slope_before"] = float(self.slope[i, k])
+            result["slope_after"] = float(self.slope[k, j])
+        return result
+
+    def fitted(self, start_year=None, end_year=None):
+        # 구간 OLS 직선의 값 (그래프용)
+        i, j = self._range(start_year, end_year)
+        x = self.years[i:j] - self.center
+        return self.years[i:j], self.intercept[i, j] + self.slope[i, j] * x
+
+    def lowess(self):
+        if self._lowess is None:
+            from statsmodels.nonparametric.smoothers_lowess import lowess
+            self._lowess = lowess(self.values, self.years, frac=LOWESS_FRAC, return_sorted=False)
+        return self._lowess
+
+    def smoothed(self, start_year=None, end_year=None):
+        # 전체 시계열 LOWESS 곡선의 구간 부분 (그래프용)
+        i, j = self._range(start_year, end_year)
+        return self.years[i:j], self.lowess()[i:j]
+
+
+def summary(indexes):
+    # 열별 전체 구간 추세 요약 표
+    rows = []
+    for column, idx in indexes.items():
+        q = idx.query()
+        rows.append({
+            '항목': column,
+            '기간': f"{int(idx.years[0])}~{int(idx.years[-1])}",
+            '연평균 변화량': q['slope'],
+            '표준오차': q['slope_se'],
+            '가속도 (/년²)': q['accel'],
+            '변화점': q['changepoint_year'],
+            '변화점 이전 기울기': q['slope_before'],
+            '변화점 이후 기울기': q['slope_after'],
+        })
+    return pd.DataFrame(rows)
+
+
+# 데이터셋 이름별로 한 번만 계산하고, 데이터셋 버전이 바뀌면 다시 계산합니다.
+_CACHE = {}
+_LOCK = threading.Lock()
+
+
+def _wide(name):
+    df = datasets.get(name)
+    if name == 'regional_fishery':
+        return df.pivot(index='연도', columns='지역', values='어획량_톤').reset_index()
+    return df
+
+
+def indexes(name):
+    key = datasets.version(name)
+    with _LOCK:
+        cached = _CACHE.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    with spans.span(f"trend_index:{name}"):
+        df = _wide(name)
+        result = {
+            column: TrendIndex(df['연도'].to_numpy()[df[column].notna()], df[column].dropna().to_numpy())
+            for column in df.columns if column != '연도'
+        }
+    with _LOCK:
+        _CACHE[name] = (key, result)
+    return result
@@ -0,0 +1,135 @@
+import threading
+
+import numpy as np
+
+import datasets
+import spans
+import trend_analysis
+
+# --- 연도 색인 시계열 ---
+# 정렬된 시간축(연도, 월/일 자료는 소수 연도)과 열별 값 배열을 한 번만 만들어 두고,
+# 슬라이더 구간마다 불리언 마스크로 DataFrame을 복사하는 대신 아래처럼 답합니다.
+#   - 구간 경계: searchsorted (O(log n))
+#   - 합계/평균/기울기와 그 표준오차: x, y, x^2, xy, y^2 누적합의 차이 (O(1), 식은 trend_analysis.ols)
+#   - 최솟값/최댓값: sparse table (O(1))
+#   - 그래프용 데이터: 원본 배열의 슬라이스 뷰 (복사 없음)
+
+
+class YearSeries:
+    def __init__(self, years, columns):
+        years = np.asarray(years, dtype=np.float64)
+        order = np.argsort(years, kind="stable")
+        self.years = np.ascontiguousarray(years[order])
+        self.values = {name: np.ascontiguousarray(np.asarray(values, dtype=np.float64)[order]) for name, values in columns.items()}
+
+        # 누적합은 시간축을 가운데로 옮겨 계산해 소수 연도에서도 자릿수 손실을 줄입니다.
+        self.center = self.years.mean() if len(self.years) else 0.0
+        x = self.years - self.center
+        self._cx = np.concatenate([[0.0], np.cumsum(x)])
+        self._cxx = np.concatenate([[0.0], np.cumsum(x * x)])
+        self._cy = {}
+        self._cxy = {}
+        self._cyy = {}
+        self._sparse_min = {}
+        self._sparse_max = {}
+        for name, y in self.values.items():
+            self._cy[name] = np.concatenate([[0.0], np.cumsum(y)])
+            self._cxy[name] = np.concatenate([[0.0], np.cumsum(x * y)])
+            self._cyy[name] = np.concatenate([[0.0], np.cumsum(y * y)])
+            self._sparse_min[name] = _sparse_table(y, np.minimum)
+            self._sparse_max[name] = _sparse_table(y, np.maximum)
+
+    @classmethod
+    def from_frame(cls, df, time_col='연도'):
+        return cls(df[time_col].to_numpy(), {c: df[c].to_numpy() for c in df.columns if c != time_col})
+
+    def __len__(self):
+        return len(self.years)
+
+    def span(self, start=None, end=None):
+        # [start, end] 양끝 포함 구간의 위치 (i, j) - years[i:j]
+        i = 0 if start is None else int(np.searchsorted(self.years, start, side="left"))
+        j = len(self.years) if end is None else int(np.searchsorted(self.years, end, side="right"))
+        return i, max(i, j)
+
+    def view(self, column, start=None, end=None):
+        i, j = self.span(start, end)
+        return self.years[i:j], self.values[column][i:j]
+
+    def count(self, start=None, end=None):
+        i, j = self.span(start, end)
+        return j - i
+
+    def first(self, column, start=None, end=None):
+        i, j = self.span(start, end)
+        return self.values[column][i] if j > i else np.nan
+
+    def last(self, column, start=None, end=None):
+        i, j = self.span(start, end)
+        return self.values[column][j - 1] if j > i else np.nan
+
+    def sum(self, column, start=None, end=None):
+        i, j = self.span(start, end)
+        return self._cy[column][j] - self._cy[column][i]
+
+    def mean(self, column, start=None, end=None):
+        i, j = self.span(start, end)
+        return (self._cy[column][j] - self._cy[column][i]) / (j - i) if j > i else np.nan
+
+    def min(self, column, start=None, end=None):
+        return self._range_query(self._sparse_min[column], np.minimum, start, end)
+
+    def max(self, column, start=None, end=None):
+        return self._range_query(self._sparse_max[column], np.maximum, start, end)
+
+    def slope(self, column, start=None, end=None):
+        # 구간 OLS 기울기 (단위/년)
+        return self.fit(column, start, end)[0]
+
+    def fit(self, column, start=None, end=None):
+        # 구간 OLS (기울기, 기울기 표준오차)
+        i, j = self.span(start, end)
+        sums = [self._cx, self._cxx, self._cy[column], self._cxy[column], self._cyy[column]]
+        slope, _, slope_se = trend_analysis.ols(j - i, *(c[j] - c[i] for c in sums))
+        return float(slope), float(slope_se)
+
+    def _range_query(self, table, op, start, end):
+        i, j = self.span(start, end)
+        if j <= i:
+            return np.nan
+        level = (j - i).bit_length() - 1
+        return op(table[level][i], table[level][j - (1 << level)])
+
+
+def _sparse_table(values, op):
+    # table[k][i] = op(values[i:i + 2^k])
+    table = [values]
+    width = 1
+    while width * 2 <= len(values):
+        prev = table[-1]
+        table.append(op(prev[:-width], prev[width:]))
+        width *= 2
+    return table
+
+
+def through_year_end(start_year, end_year):
+    # 슬라이더의 (시작 연도, 끝 연도)를 끝 연도의 마지막 날까지 포함하는 구간으로 바꿉니다. (월/일 자료용)
+    return start_year, np.nextafter(end_year + 1.0, -np.inf)
+
+
+# 데이터셋 이름별로 한 번만 만들고, 데이터셋 버전이 바뀌면 다시 만듭니다.
+_CACHE = {}
+_LOCK = threading.Lock()
+
+
+def for_dataset(name, time_col='연도'):
+    key = datasets.version(name)
+    with _LOCK:
+        cached = _CACHE.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    with spans.span(f"year_index:{name}"):
+        series = YearSeries.from_frame(datasets.get(name), time_col)
+    with _LOCK:
+        _CACHE[name] = (key, series)
+    return series